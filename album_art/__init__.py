@@ -0,0 +1,55 @@
+'''
+File: album_art/__init__.py
+Description: Package initialization with version and import logging
+'''
+
+import importlib
+import logging
+from typing import Any, Dict, List
+
+# Initialize package logger
+_logger = logging.getLogger(__name__)
+_logger.debug("Initializing album_art package")
+
+# Package version
+__version__ = "1.2.0"
+_logger.info(f"Album Art Viewer version {__version__}")
+
+# Import tracking
+__all__: List[str] = ['load_config', 'validate_paths', 'setup_logging', 'finalize_config', 'suppress_gtk_warnings', 'Tracker', 'AlbumArtApp', 'Fetcher']
+_logger.debug(f"Exporting package members: {__all__}")
+
+# Main components are imported on first access (PEP 562) so that importing the
+# package doesn't pull in yaml, PIL, mutagen, GTK and python-mpd2 up front
+_LAZY_MEMBERS: Dict[str, str] = {
+    'load_config': 'album_art.config_loader',
+    'validate_paths': 'album_art.config_loader',
+    'setup_logging': 'album_art.config_loader',
+    'finalize_config': 'album_art.config_loader',
+    'suppress_gtk_warnings': 'album_art.utils',
+    'Tracker': 'album_art.mpd_client',
+    'AlbumArtApp': 'album_art.gtk_app',
+    'Fetcher': 'album_art.fetcher',
+}
+
+def __getattr__(name: str) -> Any:
+    """Import package members lazily on first attribute access."""
+    module_name = _LAZY_MEMBERS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError:
+        _logger.critical(f"Failed to import package component {name}", exc_info=True)
+        raise
+    
+    value = getattr(module, name)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    _logger.debug(f"Lazily imported {name} from {module_name}")
+    return value
+
+def __dir__() -> List[str]:
+    """Advertise lazily imported members alongside regular globals."""
+    return sorted(set(globals()) | set(__all__))
\ No newline at end of file
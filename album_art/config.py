@@ -10,16 +10,15 @@ class Config:
     """Application configuration settings for the MPD Album Art Viewer."""
     
     # File and path settings
-    ALBUM_ART_LOC: str = os.path.expanduser("~/Downloads/.aartminip.png")
     PLACEHOLDER_LOC: str = os.path.expanduser("~/Downloads/.placeholder.png")
     MUSIC_LIBRARY: str = os.path.expanduser("~/Music")
     SONG_LIST_PATH: str = os.path.expanduser("~/Music/song_list.txt")
     
-    # Album art detection settings
-    COVER_FORMATS = {
-        "cover.jpg", "folder.jpg", "folder.png", 
-        "folder.jpeg", "cover.jpeg", "cover.png"
-    }
+    # Album art detection settings, in lookup priority order (most common first)
+    COVER_FORMATS: tuple = (
+        "cover.jpg", "folder.jpg", "cover.png",
+        "folder.png", "cover.jpeg", "folder.jpeg"
+    )
     
     # MPD connection settings
     MPDHOST: str = "localhost"
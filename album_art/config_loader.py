@@ -1,12 +1,44 @@
 import os
+import stat
+import atexit
+import queue
+import copy
+import json
+import functools
 import yaml
 import logging
 import sys
-from typing import Dict, Any, List, Tuple, Optional
+from typing import Dict, Any, FrozenSet, List, Tuple, Optional
+
+# Prefer libyaml's C parser when PyYAML was built against it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
 # Type alias for configuration dictionary
 ConfigDict = Dict[str, Any]
 
+# Required configuration sections and the settings each must contain
+_CONFIG_SCHEMA: Dict[str, FrozenSet[str]] = {
+    'file_paths': frozenset({'placeholder_loc', 'music_library', 'log_file'}),
+    'mpd': frozenset({'host', 'port'}),
+    'logging': frozenset({'level', 'format'}),
+    'display': frozenset(),
+}
+
+# Formatters keyed by format string, reused across setup_logging calls
+_CACHED_FORMATTERS: Dict[str, logging.Formatter] = {}
+
+# Background listener that writes queued log records to the log file
+_LOG_LISTENER: Optional["logging.handlers.QueueListener"] = None
+
+# Whether _stop_log_listener has been registered with atexit (done once per process)
+_LOG_LISTENER_ATEXIT_REGISTERED: bool = False
+
+# Suffix of the parsed-config sidecar written next to the YAML file
+CONFIG_CACHE_SUFFIX = '.cache.json'
+
 def expand_paths(config: ConfigDict) -> ConfigDict:
     """Expand all path values that contain tilde (~)"""
     for section in ['file_paths']:
@@ -16,6 +48,67 @@ def expand_paths(config: ConfigDict) -> ConfigDict:
                     config[section][key] = os.path.expanduser(path)
     return config
 
+def _read_config_file(config_path: str, yaml_mtime: float) -> ConfigDict:
+    """
+    Read the raw configuration, preferring the JSON sidecar when it is fresh
+    
+    The sidecar is only trusted when it is at least as new as the YAML file,
+    so editing the YAML always forces a re-parse.
+    
+    Args:
+        config_path: Path to the YAML configuration file
+        yaml_mtime: Modification time of the YAML file
+        
+    Returns:
+        Raw (unexpanded, unvalidated) configuration dictionary
+    """
+    cache_path = config_path + CONFIG_CACHE_SUFFIX
+    
+    try:
+        if os.stat(cache_path).st_mtime >= yaml_mtime:
+            with open(cache_path, 'r') as file:
+                return json.load(file)
+    except (OSError, ValueError):
+        # Missing or unreadable sidecar - fall back to parsing the YAML
+        pass
+    
+    with open(config_path, 'r') as file:
+        config = yaml.load(file, Loader=_YamlLoader)
+    
+    # A read-only filesystem shouldn't break startup, so cache writes are best-effort
+    try:
+        with open(cache_path, 'w') as file:
+            json.dump(config, file)
+    except (OSError, TypeError, ValueError):
+        pass
+    
+    return config
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(abspath: str, mtime: float) -> ConfigDict:
+    """
+    Load, expand and validate a configuration file
+    
+    Memoized on (abspath, mtime) so repeated loads of an unchanged file are a
+    dictionary lookup, while editing the file invalidates the entry.
+    
+    Args:
+        abspath: Absolute path to the YAML configuration file
+        mtime: Modification time of the file, used as part of the cache key
+        
+    Returns:
+        Loaded and processed configuration dictionary (shared - do not mutate)
+    """
+    config = _read_config_file(abspath, mtime)
+    
+    # Expand paths with tildes
+    config = expand_paths(config)
+    
+    # Validate the structure of the config
+    _validate_config_structure(config)
+    
+    return config
+
 def load_config(config_path: str = 'config.yaml') -> ConfigDict:
     """
     Load configuration from YAML file and process it
@@ -32,22 +125,11 @@ def load_config(config_path: str = 'config.yaml') -> ConfigDict:
         ValueError: If configuration structure is invalid
     """
     try:
-        import yaml
-    except ImportError:
-        print("PyYAML library not found. Please install it with: pip install pyyaml")
-        sys.exit(1)
-    
-    try:
-        with open(config_path, 'r') as file:
-            config = yaml.safe_load(file)
+        abspath = os.path.abspath(config_path)
+        mtime = os.stat(abspath).st_mtime
         
-        # Expand paths with tildes
-        config = expand_paths(config)
-        
-        # Validate the structure of the config
-        _validate_config_structure(config)
-        
-        return config
+        # Callers (e.g. finalize_config) mutate the result, so hand out a copy
+        return copy.deepcopy(_load_config_cached(abspath, mtime))
     except FileNotFoundError:
         print(f"Configuration file not found: {config_path}")
         sys.exit(1)
@@ -69,33 +151,38 @@ def _validate_config_structure(config: ConfigDict) -> bool:
         True if validation passes
         
     Raises:
-        ValueError: If any required section or setting is missing
-    """
-    required_sections: List[str] = ['file_paths', 'mpd', 'logging', 'display']
-    for section in required_sections:
-        if section not in config:
-            raise ValueError(f"Missing required configuration section: {section}")
-    
-    # Check for required file paths
-    required_paths: List[str] = ['album_art_loc', 'placeholder_loc', 'music_library', 'log_file']
-    for path in required_paths:
-        if path not in config['file_paths']:
-            raise ValueError(f"Missing required file path configuration: {path}")
-    
-    # Check for required MPD settings
-    required_mpd: List[str] = ['host', 'port']
-    for setting in required_mpd:
-        if setting not in config['mpd']:
-            raise ValueError(f"Missing required MPD configuration: {setting}")
-    
-    # Check for required logging settings
-    required_logging: List[str] = ['level', 'format']
-    for setting in required_logging:
-        if setting not in config['logging']:
-            raise ValueError(f"Missing required logging configuration: {setting}")
+        ValueError: If any required section or setting is missing (all missing keys are listed)
+    """
+    missing_sections = _CONFIG_SCHEMA.keys() - config.keys()
+    if missing_sections:
+        raise ValueError(f"Missing required configuration section(s): {', '.join(sorted(missing_sections))}")
+    
+    for section, required_keys in _CONFIG_SCHEMA.items():
+        missing_keys = required_keys - config[section].keys()
+        if missing_keys:
+            raise ValueError(f"Missing required {section} configuration: {', '.join(sorted(missing_keys))}")
     
     return True
 
+def _is_readable(st: os.stat_result) -> bool:
+    """
+    Check read permission from an existing stat result instead of a second access() call
+    
+    Args:
+        st: Result of os.stat() for the path
+        
+    Returns:
+        True if the effective user may read the path
+    """
+    euid = os.geteuid()
+    if euid == 0:
+        return True
+    if st.st_uid == euid:
+        return bool(st.st_mode & stat.S_IRUSR)
+    if st.st_gid == os.getegid() or st.st_gid in os.getgroups():
+        return bool(st.st_mode & stat.S_IRGRP)
+    return bool(st.st_mode & stat.S_IROTH)
+
 def validate_paths(config: ConfigDict) -> bool:
     """
     Validate that configured paths exist and are accessible, creating directories if needed.
@@ -120,21 +207,25 @@ def validate_paths(config: ConfigDict) -> bool:
     
     # Ensure these directories exist
     dirs_to_ensure: List[Tuple[str, str]] = [
-        (os.path.dirname(config['file_paths']['album_art_loc']), "Album art directory"),
         (os.path.dirname(config['file_paths']['placeholder_loc']), "Placeholder image directory")
     ]
     
+    # One stat() per path: existence and readability both come from its result
     for path, description in paths_to_check:
-        if not os.path.exists(path):
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
             logger.error(f"{description} path does not exist: {path}")
             raise FileNotFoundError(f"{description} path not found: {path}")
-        if not os.access(path, os.R_OK):
+        if not _is_readable(st):
             logger.error(f"Insufficient permissions for {description} path: {path}")
             raise PermissionError(f"Cannot access {description} path: {path}")
     
     # Create directories if they don't exist
     for dir_path, description in dirs_to_ensure:
-        if not os.path.exists(dir_path):
+        try:
+            os.stat(dir_path)
+        except FileNotFoundError:
             try:
                 logger.info(f"Creating {description} path: {dir_path}")
                 os.makedirs(dir_path, exist_ok=True)
@@ -145,15 +236,30 @@ def validate_paths(config: ConfigDict) -> bool:
     logger.debug("Configuration paths validated successfully")
     return True
 
+def _stop_log_listener() -> None:
+    """Stop the background log listener, writing out any queued records, and close its handlers."""
+    global _LOG_LISTENER
+    listener, _LOG_LISTENER = _LOG_LISTENER, None
+    if listener is not None:
+        listener.stop()
+        # stop() leaves the handlers open; close them so the old log file is released
+        for handler in listener.handlers:
+            handler.close()
+
 def setup_logging(config: ConfigDict) -> None:
     """
     Set up logging based on configuration with log rotation
     
+    The root logger only enqueues records through a QueueHandler; a
+    QueueListener thread does the file writes, so logging from the MPD
+    and GTK threads never blocks on disk I/O.
+    
     Args:
         config: Configuration dictionary containing logging settings
     """
+    global _LOG_LISTENER, _LOG_LISTENER_ATEXIT_REGISTERED
     import logging
-    from logging.handlers import RotatingFileHandler
+    from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
     
     log_level: int = getattr(logging, config['logging']['level'])
     log_format: str = config['logging']['format']
@@ -172,9 +278,17 @@ def setup_logging(config: ConfigDict) -> None:
     root_logger: logging.Logger = logging.getLogger()
     root_logger.setLevel(log_level)
     
+    # Already logging to this file - nothing to rebuild on a repeat call
+    abs_log_file: str = os.path.abspath(log_file)
+    if _LOG_LISTENER is not None and any(
+            isinstance(h, RotatingFileHandler) and h.baseFilename == abs_log_file
+            for h in _LOG_LISTENER.handlers):
+        return
+    
     # Remove any existing handlers to avoid duplicates
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
+    _stop_log_listener()  # Flushes records still queued for the old file
     
     # Create rotating file handler
     handler: RotatingFileHandler = RotatingFileHandler(
@@ -184,12 +298,20 @@ def setup_logging(config: ConfigDict) -> None:
         encoding='utf-8'
     )
     
-    # Set formatter
-    formatter: logging.Formatter = logging.Formatter(log_format)
+    # Set formatter, compiling each format string only once
+    formatter: Optional[logging.Formatter] = _CACHED_FORMATTERS.get(log_format)
+    if formatter is None:
+        formatter = _CACHED_FORMATTERS[log_format] = logging.Formatter(log_format)
     handler.setFormatter(formatter)
     
-    # Add handler to root logger
-    root_logger.addHandler(handler)
+    # Root logger only enqueues; the listener thread writes to the file
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    root_logger.addHandler(QueueHandler(log_queue))
+    _LOG_LISTENER = QueueListener(log_queue, handler, respect_handler_level=True)
+    _LOG_LISTENER.start()
+    if not _LOG_LISTENER_ATEXIT_REGISTERED:
+        atexit.register(_stop_log_listener)
+        _LOG_LISTENER_ATEXIT_REGISTERED = True
     
     # Log that logging has been set up
     logging.info(f"Logging initialized with rotation (max_bytes={max_bytes}, backup_count={backup_count})")
@@ -22,3 +22,10 @@ class MPDConnectionError(AlbumArtError):
 class ConfigurationError(AlbumArtError):
     """Exception raised when configuration loading or validation fails."""
     pass
+
+# Alternate spelling; the same class object so except clauses match either name
+ConfigError = ConfigurationError
+
+class DisplayError(AlbumArtError):
+    """Exception raised when the 7-segment displays fail to initialize or update."""
+    pass
@@ -1,31 +1,142 @@
 '''
 File: album_art/fetcher.py
 Description: Handles fetching album art from embedded metadata or file system with improved error handling.
+
+PIL and the mutagen format modules are imported inside the functions that use
+them so importing this module stays cheap; sys.modules makes repeat imports free.
 '''
 
 import os
 import io
 import logging
-from PIL import Image
-import mutagen.id3
-import mutagen.flac
-import mutagen.mp4
-from typing import Optional, Set, Dict, Any
+import functools
+import contextlib
+from collections import OrderedDict
+from typing import Optional, Set, Dict, Any, BinaryIO, Tuple, Union, Callable, ContextManager
 from album_art.exceptions import AlbumArtFetchError, ImageProcessingError
 from mpd import MPDClient
 
+_logger = logging.getLogger(f"{__name__}.Fetcher")
+
+# Bounding box the album art is resized to for display
+ALBUM_ART_SIZE = (500, 500)
+
+# JPEG quality for resized album art; optimize=True would double encode time for ~5% smaller files
+ALBUM_ART_JPEG_QUALITY = 85
+
+# Cover images no larger than this on either axis are used as-is, without re-encoding
+PASSTHROUGH_MAX_DIMENSION = 600
+
+# Number of albums whose resized art is kept in memory
+ALBUM_ART_CACHE_SIZE = 16
+
+# Number of raw embedded images memoized per file. These are unresized (often
+# several MB for FLAC) and repeat visits are served by the per-album cache of
+# resized art, so only a couple are kept
+EMBEDDED_ART_CACHE_SIZE = 2
+
+# Tag container implied by each audio file extension
+TAG_FORMAT_BY_EXTENSION = {
+    ".mp3": "id3",
+    ".flac": "flac",
+    ".m4a": "mp4",
+    ".mp4": "mp4",
+}
+
+# JPEG start-of-frame markers carrying the image dimensions (excludes DHT, JPG and DAC)
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+def _jpeg_dimensions(data: bytes) -> Optional[Tuple[int, int]]:
+    """
+    Read (width, height) from a JPEG's start-of-frame header without decoding it.
+    
+    Args:
+        data: Raw image bytes
+        
+    Returns:
+        Image dimensions, or None if the data is not a parseable JPEG
+    """
+    if data[:3] != b"\xff\xd8\xff":
+        return None
+    
+    pos = 2
+    length = len(data)
+    while pos + 4 <= length:
+        if data[pos] != 0xFF:
+            return None
+        marker = data[pos + 1]
+        if marker == 0xFF:
+            # Fill byte before the real marker
+            pos += 1
+            continue
+        if marker == 0x01 or 0xD0 <= marker <= 0xD7:
+            # Standalone markers have no length field
+            pos += 2
+            continue
+        segment_length = int.from_bytes(data[pos + 2:pos + 4], "big")
+        if marker in _JPEG_SOF_MARKERS:
+            if pos + 9 > length:
+                return None
+            height = int.from_bytes(data[pos + 5:pos + 7], "big")
+            width = int.from_bytes(data[pos + 7:pos + 9], "big")
+            return width, height
+        if marker == 0xDA:
+            # Start of scan reached without a frame header
+            return None
+        pos += 2 + segment_length
+    return None
+
+def _image_dimensions(data: bytes) -> Optional[Tuple[int, int]]:
+    """
+    Read (width, height) of a JPEG or PNG from its header without decoding it.
+    
+    Only these two formats are recognised, since they are the ones the display
+    can load straight from the written bytes.
+    
+    Args:
+        data: Raw image bytes
+        
+    Returns:
+        Image dimensions, or None for other formats or unparseable data
+    """
+    if data[:8] == b"\x89PNG\r\n\x1a\n" and data[12:16] == b"IHDR":
+        return int.from_bytes(data[16:20], "big"), int.from_bytes(data[20:24], "big")
+    return _jpeg_dimensions(data)
+
 class Fetcher:
     """Fetches album art from music files or directories."""
     
     def __init__(self, config):
         """Initialize the fetcher with logging and configuration."""
         self.config = config
-        self.logger = logging.getLogger(f"{__name__}.Fetcher")
+        self.logger = _logger
         self.logger.info("Initializing album art fetcher")
+        self._placeholder_png_bytes: Optional[bytes] = None
+        
+        # Album directory whose art is in current_art_bytes, and recently
+        # fetched art by album directory (LRU order) so revisits skip the fetch
+        self._current_album_dir: Optional[str] = None
+        self._album_art_cache: "OrderedDict[str, bytes]" = OrderedDict()
+        
+        # Display-ready JPEG or PNG bytes from the last get_album_art call; the
+        # display builds its texture straight from these, so art never touches disk
+        self.current_art_bytes: Optional[bytes] = None
+        
+        # Resolve configured paths once rather than on every track change
+        file_paths = self.config['file_paths']
+        self._placeholder_loc: str = file_paths['placeholder_loc']
+        self._music_library: str = file_paths['music_library']
+        self._cover_formats: Tuple[str, ...] = tuple(self.config['cover_formats'])
+        
+        # Lowercased cover names, in configured priority order, for case-insensitive matching
+        self._cover_formats_lower = tuple(dict.fromkeys(
+            name.lower() for name in self._cover_formats
+        ))
+        # The same names as a set, so directory entries are filtered by a hash lookup
+        self._cover_format_set: frozenset = frozenset(self._cover_formats_lower)
         
         try:
-            # Get placeholder location from config
-            placeholder_loc = self.config['file_paths']['placeholder_loc']
+            placeholder_loc = self._placeholder_loc
             
             # Ensure the placeholder image exists
             if not os.path.exists(placeholder_loc):
@@ -33,14 +144,18 @@ class Fetcher:
                 self._create_placeholder_image()
             else:
                 self.logger.debug(f"Using existing placeholder image at {placeholder_loc}")
+            
+            # Decode, resize and encode the placeholder once; track changes just reuse the bytes
+            self._placeholder_png_bytes = self._render_placeholder_png()
         except Exception as e:
             self.logger.critical("Failed to initialize fetcher due to placeholder image issue", exc_info=True)
             raise ImageProcessingError("Failed to initialize fetcher") from e
 
     def _create_placeholder_image(self):
         """Create a simple placeholder image if one doesn't exist."""
+        from PIL import Image
+        placeholder_loc = self._placeholder_loc
         try:
-            placeholder_loc = self.config['file_paths']['placeholder_loc']
             image_size = self.config['display']['placeholder_image_size']
             image_color = self.config['display']['placeholder_image_color']
             
@@ -49,85 +164,187 @@ class Fetcher:
             img.save(placeholder_loc, "PNG")
             self.logger.info(f"Successfully created placeholder image at {placeholder_loc}")
         except Exception as e:
-            placeholder_loc = self.config['file_paths']['placeholder_loc']
             self.logger.error(f"Failed to create placeholder image at {placeholder_loc}", exc_info=True)
             raise ImageProcessingError(f"Failed to create placeholder image: {str(e)}") from e
     
+    def _render_placeholder_png(self) -> bytes:
+        """Return the placeholder image thumbnailed to display size and encoded as PNG."""
+        placeholder_loc = self._placeholder_loc
+        
+        png_bytes = self._resize(placeholder_loc, lossless=True)
+        self.logger.debug(f"Pre-rendered placeholder image from {placeholder_loc}")
+        return png_bytes
+    
+    def _resize(self, src: Union[str, BinaryIO], lossless: bool = False) -> bytes:
+        """
+        Open an image, shrink it to display size and encode it as JPEG.
+        
+        JPEG sources are decoded via draft mode, letting libjpeg scale by 1/2-1/8
+        during the DCT instead of decoding full resolution and resampling, and
+        bilinear resampling is enough for a 500x500 target. A JPEG of cover art
+        is several times smaller than a PNG, so the display has less to decode.
+        
+        Args:
+            src: Path or binary file object of the source image
+            lossless: Encode as fast-compressed PNG instead (used for the placeholder)
+            
+        Returns:
+            The encoded image bytes
+        """
+        from PIL import Image
+        
+        buf = io.BytesIO()
+        img = Image.open(src)
+        try:
+            img.draft("RGB", ALBUM_ART_SIZE)
+        except Exception:
+            # draft() is only an optimisation; non-JPEG formats simply ignore it
+            pass
+        img.thumbnail(ALBUM_ART_SIZE, Image.Resampling.BILINEAR)
+        if lossless:
+            img.save(buf, "PNG", optimize=False, compress_level=1)
+        else:
+            img.convert("RGB").save(buf, "JPEG", quality=ALBUM_ART_JPEG_QUALITY, optimize=False)
+        return buf.getvalue()
+    
     def mutagen_fetcher(self, song_path: str) -> Optional[bytes]:
         """Extracts embedded album art using Mutagen library."""
-        if not os.path.exists(song_path):
+        try:
+            st = os.stat(song_path)
+        except FileNotFoundError:
             self.logger.warning(f"File does not exist: {song_path}")
             return None
         
-        extraction_methods = [
-            (self._extract_id3_art, "ID3 (MP3)"),
-            (self._extract_flac_art, "FLAC"),
-            (self._extract_mp4_art, "MP4/AAC")
-        ]
+        # Keyed on mtime and size as well as the path so retagging a file invalidates its entry
+        return self._extract_embedded_art(song_path, st.st_mtime_ns, st.st_size)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=EMBEDDED_ART_CACHE_SIZE)
+    def _extract_embedded_art(song_path: str, mtime_ns: int, size: int) -> Optional[bytes]:
+        """
+        Extract embedded album art, memoized across Fetcher instances.
         
-        for extraction_method, format_name in extraction_methods:
-            try:
-                self.logger.debug(f"Attempting {format_name} extraction for {os.path.basename(song_path)}")
-                art_data = extraction_method(song_path)
-                if art_data:
-                    self.logger.info(f"Successfully found {format_name} album art in: {os.path.basename(song_path)}")
-                    return art_data
-            except Exception as e:
-                self.logger.debug(f"Error extracting {format_name} album art from {os.path.basename(song_path)}: {str(e)}")
+        Args:
+            song_path: Absolute path to the audio file
+            mtime_ns: Modification time of the file (cache key only)
+            size: Size of the file in bytes (cache key only)
+            
+        Returns:
+            Raw image bytes, or None if the file has no embedded art
+        """
+        extraction_methods = {
+            "id3": (Fetcher._extract_id3_art, "ID3 (MP3)"),
+            "flac": (Fetcher._extract_flac_art, "FLAC"),
+            "mp4": (Fetcher._extract_mp4_art, "MP4/AAC")
+        }
         
-        self.logger.warning(f"No album art found in any supported format for: {os.path.basename(song_path)}")
+        # The extension identifies the container, so only run the matching parser;
+        # unknown extensions are identified from the file header and the art is
+        # read from that same parse instead of trying every parser in turn
+        base = os.path.basename(song_path)
+        tag_format = TAG_FORMAT_BY_EXTENSION.get(os.path.splitext(song_path)[1].lower())
+        if tag_format is None:
+            extraction_method, format_name = Fetcher._extract_detected_art, "auto-detected"
+        else:
+            extraction_method, format_name = extraction_methods[tag_format]
+        try:
+            _logger.debug("Attempting %s extraction for %s", format_name, base)
+            art_data = extraction_method(song_path, base)
+            if art_data:
+                _logger.info("Successfully found %s album art in: %s", format_name, base)
+                return art_data
+        except Exception as e:
+            _logger.debug("Error extracting %s album art from %s: %s", format_name, base, e)
+        
+        _logger.warning("No album art found in any supported format for: %s", base)
         return None  # No album art found
     
-    def _extract_id3_art(self, song_path: str) -> Optional[bytes]:
+    @staticmethod
+    def _extract_detected_art(song_path: str, base: str) -> Optional[bytes]:
+        """Extract album art from a file with an unrecognised extension.
+        
+        mutagen.File identifies the container from its header, and the art is
+        taken from that parsed object, so the file is only read once.
+        """
+        import mutagen
+        import mutagen.flac
+        import mutagen.mp4
+        import mutagen.id3
+        try:
+            audio = mutagen.File(song_path)
+        except Exception as e:
+            _logger.debug("Could not identify audio format of %s: %s", base, e)
+            return None
+        if isinstance(audio, mutagen.flac.FLAC):
+            pictures = audio.pictures
+            return pictures[0].data if pictures and pictures[0].data else None
+        if isinstance(audio, mutagen.mp4.MP4):
+            covr_list = audio.get('covr', [])
+            return covr_list[0] if covr_list and covr_list[0] else None
+        if isinstance(audio, mutagen.id3.ID3FileType):
+            apic_frames = audio.tags.getall('APIC') if audio.tags is not None else []
+            return apic_frames[0].data if apic_frames and apic_frames[0].data else None
+        _logger.debug("Unsupported audio format for %s: %s", base, type(audio).__name__)
+        return None
+    
+    @staticmethod
+    def _extract_id3_art(song_path: str, base: str) -> Optional[bytes]:
         """Extract album art from ID3 tags (MP3 files)."""
+        import mutagen.id3
         try:
             id3 = mutagen.id3.ID3(song_path)
             apic_frames = id3.getall('APIC')
             if apic_frames and apic_frames[0].data:  # Ensure there's at least one APIC frame
-                self.logger.debug(f"Found APIC frame in ID3 tags for {os.path.basename(song_path)}")
+                _logger.debug("Found APIC frame in ID3 tags for %s", base)
                 return apic_frames[0].data
         except mutagen.id3.ID3NoHeaderError:
             # This is expected for non-MP3 files, so we'll just log at debug level
-            self.logger.debug(f"No ID3 header found in {os.path.basename(song_path)}")
+            _logger.debug("No ID3 header found in %s", base)
             return None
         except Exception as e:
-            self.logger.debug(f"ID3 extraction error for {os.path.basename(song_path)}: {str(e)}")
+            _logger.debug("ID3 extraction error for %s: %s", base, e)
             return None
-        self.logger.debug(f"No APIC frames found in ID3 tags for {os.path.basename(song_path)}")
+        _logger.debug("No APIC frames found in ID3 tags for %s", base)
         return None
     
-    def _extract_flac_art(self, song_path: str) -> Optional[bytes]:
+    @staticmethod
+    def _extract_flac_art(song_path: str, base: str) -> Optional[bytes]:
         """Extract album art from FLAC files."""
+        import mutagen.flac
         try:
             flac = mutagen.flac.FLAC(song_path)
             if flac.pictures and flac.pictures[0].data:  # Ensure there's at least one embedded picture
-                self.logger.debug(f"Found embedded picture in FLAC file {os.path.basename(song_path)}")
+                _logger.debug("Found embedded picture in FLAC file %s", base)
                 return flac.pictures[0].data
         except mutagen.flac.FLACNoHeaderError:
             # This is expected for non-FLAC files, so we'll just log at debug level
-            self.logger.debug(f"No FLAC header found in {os.path.basename(song_path)}")
+            _logger.debug("No FLAC header found in %s", base)
             return None
         except Exception as e:
-            self.logger.debug(f"FLAC extraction error for {os.path.basename(song_path)}: {str(e)}")
+            _logger.debug("FLAC extraction error for %s: %s", base, e)
             return None
-        self.logger.debug(f"No pictures found in FLAC file {os.path.basename(song_path)}")
+        _logger.debug("No pictures found in FLAC file %s", base)
         return None
     
-    def _extract_mp4_art(self, song_path: str) -> Optional[bytes]:
+    @staticmethod
+    def _extract_mp4_art(song_path: str, base: str) -> Optional[bytes]:
         """Extract album art from MP4/AAC files."""
+        import mutagen.mp4
         try:
             mp4 = mutagen.mp4.MP4(song_path)
             covr_list = mp4.get('covr', [])  # Use `.get()` to avoid KeyError
             if covr_list and covr_list[0]:  # Ensure there's at least one embedded cover
-                self.logger.debug(f"Found 'covr' data in MP4 file {os.path.basename(song_path)}")
+                _logger.debug("Found 'covr' data in MP4 file %s", base)
                 return covr_list[0]
         except Exception as e:
-            self.logger.debug(f"MP4 extraction error for {os.path.basename(song_path)}: {str(e)}")
+            _logger.debug("MP4 extraction error for %s: %s", base, e)
             return None
-        self.logger.debug(f"No 'covr' data found in MP4 file {os.path.basename(song_path)}")
+        _logger.debug("No 'covr' data found in MP4 file %s", base)
         return None
     
-    def get_album_art(self, song_file: str, mpd_client: MPDClient) -> None:
+    def get_album_art(self, song_file: str, mpd_client: MPDClient,
+                      is_cancelled: Optional[Callable[[], bool]] = None,
+                      mpd_lock: Optional[ContextManager] = None) -> bool:
         """
     Attempts to retrieve album art using multiple methods and save it.
     
@@ -136,63 +353,148 @@ class Fetcher:
     2. Then attempts to extract embedded art using Mutagen
     3. Finally looks for common cover art filenames in the song's directory
     
-    For each source, the art is resized to a standard size and saved to the
-    configured location. If no art is found, a placeholder image is used.
+    For each source, the art is resized to a standard size if needed and kept
+    in current_art_bytes; nothing is written to disk. If no art is found, the
+    pre-rendered placeholder is used instead.
+    
+    Art is cached per album directory: another track from the album already
+    shown keeps the current art, and a recently shown album is restored from
+    memory without fetching or resizing. This assumes every track in a
+    directory shares one cover; folders of singles or compilations with
+    per-track embedded art show the first fetched track's cover. Songs at the
+    library root (no directory) are never cached and always fetched.
     
     Args:
         song_file: Path to the audio file relative to music library
         mpd_client: Connected MPD client instance
+        is_cancelled: Checked before each fetch method; once it returns True the
+            fetch is abandoned without falling back to the placeholder
+        mpd_lock: Held only around commands sent over mpd_client, so the
+            client's other users are not blocked by file parsing or resizing
+        
+    Returns:
+        True if current_art_bytes changed, False if it already held this album's art
+        or the fetch was cancelled
             
     Raises:
         AlbumArtFetchError: If a critical error occurs during fetching
     """
         self.logger.info(f"Starting album art fetch for: {song_file}")
+        # Checked once so the debug calls below cost nothing at the default INFO level
+        _dbg = self.logger.isEnabledFor(logging.DEBUG)
         
-        music_library = self.config['file_paths']['music_library']
-        full_song_path = os.path.join(music_library, song_file)
-        self.logger.debug(f"Full song path: {full_song_path}")
+        full_song_path = os.path.join(self._music_library, song_file)
+        if _dbg:
+            self.logger.debug(f"Full song path: {full_song_path}")
 
-        # Set default placeholder image first
-        try:
-            placeholder_loc = self.config['file_paths']['placeholder_loc']
-            album_art_loc = self.config['file_paths']['album_art_loc']
-            
-            if not os.path.exists(placeholder_loc):
-                self.logger.warning("Placeholder image missing, creating new one")
-                self._create_placeholder_image()
-                
-            default_img = Image.open(placeholder_loc)
-            default_img.thumbnail((500, 500))
-            default_img.save(album_art_loc, "PNG")
-            self.logger.debug("Default placeholder image set successfully")
-        except Exception as e:
-            self.logger.error("Failed to set default album art", exc_info=True)
-            raise AlbumArtFetchError("Failed to set default album art") from e
+        # Empty for songs at the library root, which are not grouped into an album
+        album_dir = os.path.dirname(song_file)
+        if album_dir and album_dir == self._current_album_dir and self.current_art_bytes is not None:
+            if _dbg:
+                self.logger.debug(f"Album art already current for album: {album_dir}")
+            return False
+        
+        cached_art = self._album_art_cache.get(album_dir) if album_dir else None
+        if cached_art is not None:
+            self._album_art_cache.move_to_end(album_dir)
+            self._current_album_dir = album_dir
+            self.current_art_bytes = cached_art
+            self.logger.info(f"Restored cached album art for album: {album_dir}")
+            return True
+        
+        # Until new art is found the current art no longer matches any album
+        self._current_album_dir = None
+        self.current_art_bytes = None
 
         if not os.path.exists(full_song_path):
             self.logger.warning(f"Song file does not exist: {full_song_path}")
-            return
+            self._use_placeholder()
+            return True
         
         # Define fetch methods with friendly names for logging
         fetch_methods = [
-            ("MPD readpicture", self._fetch_mpd_readpicture),
+            ("MPD readpicture", functools.partial(self._fetch_mpd_readpicture, mpd_lock=mpd_lock)),
             ("Mutagen metadata", self._fetch_mutagen_metadata),
             ("File-based cover", self._fetch_file_based_cover)
         ]
         
         # Try each fetch method in sequence
         for method_name, fetch_method in fetch_methods:
+            if is_cancelled is not None and is_cancelled():
+                self.logger.info(f"Album art fetch cancelled for: {song_file}")
+                return False
             try:
-                self.logger.debug(f"Attempting album art fetch method: {method_name}")
-                if fetch_method(song_file, mpd_client, full_song_path):
+                if _dbg:
+                    self.logger.debug(f"Attempting album art fetch method: {method_name}")
+                art_bytes = fetch_method(song_file, mpd_client, full_song_path)
+                if art_bytes:
                     self.logger.info(f"Successfully fetched album art using {method_name}")
-                    return
+                    self._remember_album_art(album_dir, art_bytes)
+                    return True
             except Exception as e:
                 self.logger.warning(f"Album art fetch method {method_name} failed: {str(e)}", exc_info=True)
         
         self.logger.warning(f"All album art fetch methods failed for: {song_file}")
+        # The placeholder is not cached, so the album's other tracks still get a fetch
+        self._use_placeholder()
+        return True
+
+    def _remember_album_art(self, album_dir: str, art_bytes: bytes) -> None:
+        """Make art_bytes the current art and cache it under its album directory."""
+        self.current_art_bytes = art_bytes
+        if not album_dir:
+            return  # Library root: each song has its own art
+        self._album_art_cache[album_dir] = art_bytes
+        self._album_art_cache.move_to_end(album_dir)
+        if len(self._album_art_cache) > ALBUM_ART_CACHE_SIZE:
+            self._album_art_cache.popitem(last=False)  # Evict least recently used
+        self._current_album_dir = album_dir
+
+    def _use_placeholder(self) -> None:
+        """
+        Make the pre-rendered placeholder the current art.
+        
+        Only used once every fetch method has failed.
+        
+        Raises:
+            AlbumArtFetchError: If the placeholder could not be rendered
+        """
+        try:
+            # The placeholder is pre-rendered in __init__; only redo it if that failed
+            if self._placeholder_png_bytes is None:
+                if not os.path.exists(self._placeholder_loc):
+                    self.logger.warning("Placeholder image missing, creating new one")
+                    self._create_placeholder_image()
+                self._placeholder_png_bytes = self._render_placeholder_png()
+            
+            self.current_art_bytes = self._placeholder_png_bytes
+            self.logger.debug("Placeholder image set as album art")
+        except Exception as e:
+            self.logger.error("Failed to set default album art", exc_info=True)
+            raise AlbumArtFetchError("Failed to set default album art") from e
 
-    def _fetch_mpd_readpicture(self, song_file: str, mpd_client: MPDClient, full_song_path: str) -> bool:
+    def _prepare_art_bytes(self, data: bytes) -> bytes:
+        """
+        Return image bytes ready for display, re-encoding only when they need shrinking.
+        
+        Small JPEG and PNG covers are used as-is, skipping the decode,
+        resample and JPEG encode; anything else goes through _resize.
+        
+        Args:
+            data: Raw image bytes
+            
+        Returns:
+            Display-ready JPEG or PNG bytes
+        """
+        dimensions = _image_dimensions(data)
+        if dimensions and max(dimensions) <= PASSTHROUGH_MAX_DIMENSION:
+            self.logger.debug(f"Using {dimensions[0]}x{dimensions[1]} image without re-encoding")
+            return data
+        
+        return self._resize(io.BytesIO(data))
+
+    def _fetch_mpd_readpicture(self, song_file: str, mpd_client: MPDClient, full_song_path: str,
+                               mpd_lock: Optional[ContextManager] = None) -> Optional[bytes]:
         """
         Fetch album art using MPD's readpicture command.
         
@@ -204,90 +506,108 @@ class Fetcher:
             song_file: Path to song file relative to music library
             mpd_client: Connected MPD client instance
             full_song_path: Absolute path to the song file
+            mpd_lock: Held for the readpicture command only, not the resize
             
         Returns:
-            bool: True if successful, False otherwise
+            Display-ready image bytes, or None if no art was found
         """
         self.logger.debug("Attempting MPD readpicture method")
         try:
-            art_data = mpd_client.readpicture(song_file)
-            album_art_loc = self.config['file_paths']['album_art_loc']
+            with mpd_lock if mpd_lock is not None else contextlib.nullcontext():
+                art_data = mpd_client.readpicture(song_file)
             
             if isinstance(art_data, dict) and 'binary' in art_data:
+                # python-mpd2 has already joined every chunk, so even a large
+                # cover is used here (and shrunk) rather than read again via mutagen
                 img_bytes = art_data['binary']
-                img = Image.open(io.BytesIO(img_bytes))
-                img.thumbnail((500, 500))
-                img.save(album_art_loc, "PNG")
+                art_bytes = self._prepare_art_bytes(img_bytes)
                 self.logger.debug("Successfully processed album art from MPD readpicture")
-                return True
+                return art_bytes
             
             self.logger.debug("MPD readpicture returned no valid art data")
-            return False
+            return None
         except Exception as e:
             self.logger.warning(f"MPD readpicture method failed: {str(e)}")
-            return False
+            return None
 
-    def _fetch_mutagen_metadata(self, song_file: str, mpd_client: MPDClient, full_song_path: str) -> bool:
+    def _fetch_mutagen_metadata(self, song_file: str, mpd_client: MPDClient, full_song_path: str) -> Optional[bytes]:
         """
         Fetch album art using Mutagen metadata extraction.
         
         Returns:
-            bool: True if successful, False otherwise
+            Display-ready image bytes, or None if no art was found
         """
         self.logger.debug("Attempting Mutagen metadata extraction method")
         try:
             art_data = self.mutagen_fetcher(full_song_path)
-            album_art_loc = self.config['file_paths']['album_art_loc']
             
             if art_data:
-                img = Image.open(io.BytesIO(art_data))
-                img.thumbnail((500, 500))
-                img.save(album_art_loc, "PNG")
+                art_bytes = self._prepare_art_bytes(art_data)
                 self.logger.debug("Successfully processed album art from Mutagen metadata")
-                return True
+                return art_bytes
             
             self.logger.debug("No album art found in mutagen metadata")
-            return False
+            return None
         except Exception as e:
             self.logger.warning(f"Mutagen metadata extraction failed: {str(e)}")
-            return False
+            return None
 
-    def _fetch_file_based_cover(self, song_file: str, mpd_client: MPDClient, full_song_path: str) -> bool:
+    def _fetch_file_based_cover(self, song_file: str, mpd_client: MPDClient, full_song_path: str) -> Optional[bytes]:
         """
         Look for album art image files in the same directory as the music file.
         
         Returns:
-            bool: True if successful, False otherwise
+            Display-ready image bytes, or None if no art was found
         """
-        self.logger.debug("Attempting file-based cover art method")
+        from PIL import Image
+        _dbg = self.logger.isEnabledFor(logging.DEBUG)
+        if _dbg:
+            self.logger.debug("Attempting file-based cover art method")
         try:
             song_dir = os.path.dirname(full_song_path)
-            album_art_loc = self.config['file_paths']['album_art_loc']
             
-            if not os.path.isdir(song_dir):
+            # One directory read instead of a stat() per candidate filename,
+            # keyed by lowercased name so Cover.JPG matches cover.jpg; only
+            # entries named like a cover are kept (and checked with is_file)
+            if _dbg:
+                self.logger.debug(f"Searching for cover art files in: {song_dir}")
+            cover_format_set = self._cover_format_set
+            try:
+                with os.scandir(song_dir) as entries:
+                    names = {
+                        lower: entry.name
+                        for entry in entries
+                        if (lower := entry.name.lower()) in cover_format_set and entry.is_file()
+                    }
+            except (FileNotFoundError, NotADirectoryError):
                 self.logger.warning(f"Song directory does not exist: {song_dir}")
-                return False
-                
-            # Use cover formats from config
-            cover_formats = self.config['cover_formats']
+                return None
             
-            self.logger.debug(f"Searching for cover art files in: {song_dir}")
-            for filename in cover_formats:
-                cover_path = os.path.join(song_dir, filename)
-                if os.path.exists(cover_path):
-                    self.logger.debug(f"Found cover art file: {cover_path}")
+            for cover_name in self._cover_formats_lower:
+                filename = names.get(cover_name)
+                if filename:
+                    cover_path = os.path.join(song_dir, filename)
+                    if _dbg:
+                        self.logger.debug(f"Found cover art file: {cover_path}")
                     try:
-                        img = Image.open(cover_path)
-                        img.thumbnail((500, 500))
-                        img.save(album_art_loc, "PNG")
-                        self.logger.debug(f"Successfully processed cover art from file: {filename}")
-                        return True
+                        # Image.open only parses the header, so probing the size is cheap
+                        with Image.open(cover_path) as probe:
+                            width, height = probe.size
+                        if max(width, height) <= PASSTHROUGH_MAX_DIMENSION:
+                            with open(cover_path, "rb") as f:
+                                art_bytes = f.read()
+                        else:
+                            art_bytes = self._resize(cover_path)
+                        if _dbg:
+                            self.logger.debug(f"Successfully processed cover art from file: {filename}")
+                        return art_bytes
                     except Exception as e:
                         self.logger.warning(f"Error processing cover art file {filename}: {str(e)}")
                         # Continue to next file
             
-            self.logger.debug(f"No valid cover art files found in: {song_dir}")
-            return False
+            if _dbg:
+                self.logger.debug(f"No valid cover art files found in: {song_dir}")
+            return None
         except Exception as e:
             self.logger.warning(f"File-based cover art method failed: {str(e)}")
-            return False
\ No newline at end of file
+            return None
\ No newline at end of file
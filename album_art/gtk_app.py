@@ -5,37 +5,110 @@ Description: GTK-based Album Art Viewer Application with improved error handling
 app_instance = None
 import time
 import gi
+import hashlib
 import threading
 import os
 import logging
 import signal
+from collections import OrderedDict
 from typing import Dict, List, Tuple, Optional, Any, Union, Callable, TypeVar, cast
-from gi.repository import Gtk, GLib, Gdk, Pango
+from gi.repository import Gtk, GLib, Gdk, GdkPixbuf, Gio, Pango
 
 from album_art.mpd_client import Tracker
-from album_art.fetcher import Fetcher
 from album_art.exceptions import AlbumArtError
-from PIL import Image
 import numpy as np
 
 # Define some type aliases for clarity
 RGB = List[int]  # RGB color as [r, g, b]
 SongInfo = Dict[str, str]  # MPD song information dictionary
+AlbumArt = Tuple[Gdk.Texture, RGB, RGB]  # Album art texture with its left/right edge colors
+GradientKey = Tuple[Tuple[int, ...], Tuple[int, ...]]  # 4-bit-per-channel left/right colors
+
+# Escapes Pango markup characters in a single str.translate pass
+_PANGO_ESCAPE_TABLE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+
+# Number of pixels sampled down each edge of the album art for the background gradient
+EDGE_SAMPLE_POINTS = 20
+
+# Bounding box album art is scaled into when decoded for edge sampling
+EDGE_DECODE_SIZE = (64, 64)
+
+# Number of album art images whose edge colors are remembered
+COLOR_CACHE_SIZE = 32
+
+# Number of distinct background gradients whose CSS is remembered
+GRADIENT_CSS_CACHE_SIZE = 256
+
+# Named gradient colors, formatted directly as bytes from packed 0xRRGGBB ints
+GRADIENT_COLORS_CSS_TEMPLATE = b"@define-color grad_left #%06x; @define-color grad_right #%06x;"
+BLACK_GRADIENT_COLORS_CSS = GRADIENT_COLORS_CSS_TEMPLATE % (0, 0)
+
+# MPD reconnection backoff used by the monitoring thread
+MPD_CONNECTION_RETRY_DELAY = 2  # seconds
+MPD_MAX_CONNECTION_ATTEMPTS = 10
+
+# Digit typed by each number key, on the main row and the numeric keypad
+_DIGIT_KEYVALS: Dict[int, str] = {
+    **{getattr(Gdk, f"KEY_{digit}"): str(digit) for digit in range(10)},
+    **{getattr(Gdk, f"KEY_KP_{digit}"): str(digit) for digit in range(10)},
+}
+
+def _edge_means(pixels: np.ndarray) -> np.ndarray:
+    """
+    Reduce the leftmost and rightmost pixel columns to their mean RGB colors.
+    
+    Up to EDGE_SAMPLE_POINTS evenly strided rows are taken; both edge columns
+    are gathered together, so the sampled rows are traversed and copied once.
+    
+    Args:
+        pixels: (height, width, 3) RGB image array
+        
+    Returns:
+        (2, 3) uint8 array holding the mean left and right RGB colors
+    """
+    height: int = pixels.shape[0]
+    step: int = max(1, height // EDGE_SAMPLE_POINTS)
+    edge_pixels: np.ndarray = pixels[::step, [0, pixels.shape[1] - 1]][:EDGE_SAMPLE_POINTS]
+    
+    # Integer mean: sum in uint32 and floor-divide rather than going through float64
+    means: np.ndarray = edge_pixels.sum(axis=0, dtype=np.uint32) // edge_pixels.shape[0]
+    return means.astype(np.uint8)
 
 class AlbumArtApp(Gtk.Application):
     """Main GTK application for displaying album art and handling user input."""
     
+    # Fixed Pango markup around escaped label text, concatenated rather than re-formatted per update
+    _SPAN_SUFFIX: str = '</span>'
+    _ARTIST_PREFIX: str = '<span foreground="white" font="16" weight="bold">'
+    _TITLE_PREFIX: str = '<span foreground="white" font="14">'
+    _QUEUE_PREFIX: str = '<span foreground="white" font="16" weight="bold">Added to queue:\n'
+    _COMMAND_PREFIX: str = '<span foreground="#FFA500" font="18" weight="bold">Command: '
+    
     def __init__(self, tracker: Tracker, config) -> None:
         super().__init__()
         self.config = config
-        self.fetcher: Fetcher = Fetcher(self.config)
         self.running = threading.Event()  # ← Replace boolean with Event
         self.running.set()  # Set to "True" initially
         self.logger: logging.Logger = logging.getLogger(__name__)
         self.tracker: Tracker = tracker
+        self.tracker.on_album_art_ready = self._on_album_art_ready
         self.image: Optional[Gtk.Picture] = None
+        self._placeholder_texture: Optional[Gdk.Texture] = None
+        # Bytes object last decoded by load_album_art and its result; the fetcher
+        # hands over the same object for another track from the same album and
+        # for its pre-rendered placeholder, so those tracks skip the decode
+        self._last_decoded_art: Optional[Tuple[bytes, AlbumArt]] = None
         self.tracker_thread: Optional[threading.Thread] = None
         
+        # Coalescing state: at most one album art handoff queued on the main loop,
+        # and one pending timer to clear the song info labels
+        self._update_pending: bool = False
+        self._pending_change: Tuple[Optional[AlbumArt], Optional[Tuple[str, str]]] = (None, None)
+        self._song_info_clear_id: Optional[int] = None
+        
+        # Edge colors of recently shown album art, keyed by image content (LRU order)
+        self._color_cache: "OrderedDict[bytes, Tuple[RGB, RGB]]" = OrderedDict()
+        
                 
         # Set the global app_instance
         global app_instance
@@ -46,6 +119,11 @@ class AlbumArtApp(Gtk.Application):
         self.title_label: Optional[Gtk.Label] = None
         self.window: Optional[Gtk.ApplicationWindow] = None
         self.css_provider: Optional[Gtk.CssProvider] = None
+        self._css_provider_attached: bool = False
+        self._last_gradient: Optional[GradientKey] = None
+        # Gradient color CSS keyed by quantized edge colors (LRU order)
+        self._gradient_css_cache: "OrderedDict[GradientKey, bytes]" = OrderedDict()
+        self._mpd_connection_attempts: int = 0
         self.queue_notification_label: Optional[Gtk.Label] = None
         
         # Set up signal handlers for graceful shutdown
@@ -59,80 +137,115 @@ class AlbumArtApp(Gtk.Application):
         self.logger.info(f"Received signal {sig}, initiating shutdown")
         self.quit()
     
-    def get_dominant_edge_colors(self, image_path: str) -> Tuple[RGB, RGB]:
-        """Extract dominant colors from left and right edges of the album art using NumPy."""
-        if not os.path.exists(image_path):
-            self.logger.error(f"Image file not found: {image_path}")
-            return [0, 0, 0], [0, 0, 0]
+    def get_dominant_edge_colors(self, image_data: bytes) -> Tuple[RGB, RGB]:
+        """
+        Extract dominant colors from left and right edges of the album art using NumPy.
+        
+        Results are cached by a digest of the image bytes, so art seen recently
+        skips the decode and reduction entirely.
+        """
+        cache_key: bytes = hashlib.blake2b(image_data, digest_size=16).digest()
+        cached: Optional[Tuple[RGB, RGB]] = self._color_cache.get(cache_key)
+        if cached is not None:
+            self._color_cache.move_to_end(cache_key)
+            self.logger.debug("Using cached edge colors")
+            return cached
             
         try:
-            img: Image.Image = Image.open(image_path)
-            img_array: np.ndarray = np.array(img)
+            # Single small decode through the same gdk-pixbuf loaders GTK uses for the texture
+            stream: Gio.InputStream = Gio.MemoryInputStream.new_from_bytes(GLib.Bytes.new(image_data))
+            pixbuf: GdkPixbuf.Pixbuf = GdkPixbuf.Pixbuf.new_from_stream_at_scale(
+                stream, EDGE_DECODE_SIZE[0], EDGE_DECODE_SIZE[1], True, None)
             
             # Get image dimensions
-            height: int
-            width: int
-            height, width = img_array.shape[:2]
-            
-            # Sample pixels from left and right edges
-            sample_points: int = min(20, height)
-            sample_indices: np.ndarray = np.linspace(0, height-1, sample_points, dtype=int)
+            width: int = pixbuf.get_width()
+            height: int = pixbuf.get_height()
+            channels: int = pixbuf.get_n_channels()
             
-            # Extract left and right edge pixels
-            left_edge_pixels: np.ndarray = img_array[sample_indices, 0, :3]  # x=0
-            right_edge_pixels: np.ndarray = img_array[sample_indices, width-1, :3]  # x=width-1
+            # View the pixel rows through their rowstride; the last row is not padded,
+            # so the buffer cannot simply be reshaped to rowstride-wide rows. Only the
+            # three RGB bytes of each pixel are exposed, so alpha is never read
+            pixels: np.ndarray = np.ndarray(
+                shape=(height, width, 3), dtype=np.uint8,
+                buffer=pixbuf.get_pixels(), strides=(pixbuf.get_rowstride(), channels, 1))
             
-            # Calculate mean colors
-            left_color: np.ndarray = np.mean(left_edge_pixels, axis=0).astype(int)
-            right_color: np.ndarray = np.mean(right_edge_pixels, axis=0).astype(int)
+            left_color: RGB
+            right_color: RGB
+            left_color, right_color = _edge_means(pixels).tolist()
             
             self.logger.debug(f"Dominant left edge color: RGB{tuple(left_color)}")
             self.logger.debug(f"Dominant right edge color: RGB{tuple(right_color)}")
             
-            return left_color.tolist(), right_color.tolist()
+            colors: Tuple[RGB, RGB] = (left_color, right_color)
+            self._color_cache[cache_key] = colors
+            if len(self._color_cache) > COLOR_CACHE_SIZE:
+                self._color_cache.popitem(last=False)  # Evict least recently used
+            return colors
         except Exception as e:
-            self.logger.error(f"Error extracting colors from image: {image_path} - {str(e)}", exc_info=True)
+            self.logger.error(f"Error extracting colors from image: {str(e)}", exc_info=True)
             return [0, 0, 0], [0, 0, 0]  # Default to black if error occurs
     
     def update_background_gradient(self, left_color: RGB, right_color: RGB) -> None:
-        """Update the window background with a gradient using the dominant edge colors."""
+        """
+        Update the window background with a gradient using the dominant edge colors.
+        
+        The gradient rule itself is installed once in do_activate and refers to the
+        named colors @grad_left and @grad_right; only their two definitions are
+        reparsed here.
+        """
         if not self.css_provider:
             self.css_provider = Gtk.CssProvider()
+            self._css_provider_attached = False
         
         try:
-            # Convert RGB to hex
-            left_hex: str = "#{:02x}{:02x}{:02x}".format(*left_color)
-            right_hex: str = "#{:02x}{:02x}{:02x}".format(*right_color)
+            # Quantize to 4 bits per channel; the difference is imperceptible in a
+            # gradient and lets most albums share a cached CSS string
+            gradient_key: GradientKey = (
+                tuple(c >> 4 for c in left_color), tuple(c >> 4 for c in right_color))
+            
+            # Same colors as the current background - skip the CSS parse and restyle
+            if gradient_key == self._last_gradient:
+                self.logger.debug("Background gradient unchanged")
+                return
             
-            # Create CSS with linear gradient
-            css: str = f"""
-                window {{
-                    background: linear-gradient(to right, {left_hex}, {right_hex});
-                }}
-            """
+            css: Optional[bytes] = self._gradient_css_cache.get(gradient_key)
+            if css is None:
+                # Expand each nibble back to a full byte (0xa -> 0xaa) and pack as 0xRRGGBB
+                left_int: int = 0
+                right_int: int = 0
+                for c in gradient_key[0]:
+                    left_int = (left_int << 8) | (c << 4) | c
+                for c in gradient_key[1]:
+                    right_int = (right_int << 8) | (c << 4) | c
+                css = GRADIENT_COLORS_CSS_TEMPLATE % (left_int, right_int)
+                self._gradient_css_cache[gradient_key] = css
+                if len(self._gradient_css_cache) > GRADIENT_CSS_CACHE_SIZE:
+                    self._gradient_css_cache.popitem(last=False)  # Evict least recently used
+            else:
+                self._gradient_css_cache.move_to_end(gradient_key)
             
-            self.css_provider.load_from_data(css.encode('utf-8'))
+            self.css_provider.load_from_data(css)
             
-            # Apply CSS to window
+            # Apply CSS to window; reloading an attached provider restyles it without re-adding
             if self.window:
-                context: Gtk.StyleContext = self.window.get_style_context()
-                context.add_provider(self.css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION)
-                self.logger.debug(f"Updated background gradient from {left_hex} to {right_hex}")
+                if not self._css_provider_attached:
+                    context: Gtk.StyleContext = self.window.get_style_context()
+                    context.add_provider(self.css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION)
+                    self._css_provider_attached = True
+                self._last_gradient = gradient_key
+                self.logger.debug(f"Updated background gradient: {css.decode('ascii')}")
             else:
                 self.logger.warning("Cannot update background: window not initialized")
         except Exception as e:
             self.logger.error(f"Failed to update background gradient: {str(e)}", exc_info=True)
             # Fall back to a solid black background
+            self._last_gradient = None
             try:
-                css = """
-                    window {
-                        background-color: #000000;
-                    }
-                """
-                self.css_provider.load_from_data(css.encode('utf-8'))
-                if self.window:
+                self.css_provider.load_from_data(BLACK_GRADIENT_COLORS_CSS)
+                if self.window and not self._css_provider_attached:
                     context: Gtk.StyleContext = self.window.get_style_context()
                     context.add_provider(self.css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION)
+                    self._css_provider_attached = True
             except Exception as e2:
                 self.logger.error(f"Failed to set fallback background: {str(e2)}", exc_info=True)
     
@@ -212,16 +325,22 @@ class AlbumArtApp(Gtk.Application):
             key_controller.connect("key-pressed", self.on_key_press)
             self.window.add_controller(key_controller)
             
-            # Apply initial CSS for background color (will be updated later)
-            self.css_provider = Gtk.CssProvider()
-            self.css_provider.load_from_data(b"""
+            # The gradient rule is parsed once; song changes only redefine its two colors
+            gradient_provider: Gtk.CssProvider = Gtk.CssProvider()
+            gradient_provider.load_from_data(b"""
                 window {
-                    background-color: #000000;  /* Initial black background */
+                    background: linear-gradient(to right, @grad_left, @grad_right);
                 }
             """)
             
+            # Initial black background (will be updated later)
+            self.css_provider = Gtk.CssProvider()
+            self.css_provider.load_from_data(BLACK_GRADIENT_COLORS_CSS)
+            
             context: Gtk.StyleContext = self.window.get_style_context()
             context.add_provider(self.css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION)
+            context.add_provider(gradient_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION)
+            self._css_provider_attached = True
             
             # Start MPD monitoring thread
             self.tracker_thread = threading.Thread(target=self.mpd_loop, daemon=True)
@@ -229,7 +348,6 @@ class AlbumArtApp(Gtk.Application):
             self.logger.info("MPD monitoring thread started")
             
             self.window.present()
-            GLib.idle_add(self.update_album_art)
             self.logger.info("AlbumArtApp activation completed")
         except Exception as e:
             self.logger.critical(f"Failed to activate AlbumArtApp: {str(e)}", exc_info=True)
@@ -261,55 +379,108 @@ class AlbumArtApp(Gtk.Application):
                     self.quit()
                     return True  # Event handled
             
-            # Process numeric input (numbers 0-9)
-            keychar: Optional[str] = chr(keyval) if 48 <= keyval <= 57 else None  # 48-57 are ASCII for 0-9
-            if keychar:  # If the key pressed is a digit
-                self.logger.debug(f"Numeric key pressed: {keychar}")
-                # Forward the input to the tracker
-                self.tracker.handle_input(keychar)
+            # Process numeric input (0-9 on the main row or the numeric keypad)
+            keychar: Optional[str] = _DIGIT_KEYVALS.get(keyval)
+            if keychar is None:
+                return False  # Allow event propagation
             
+            self.logger.debug(f"Numeric key pressed: {keychar}")
+            # Forward the input to the tracker
+            self.tracker.handle_input(keychar)
             return False  # Allow event propagation
         except Exception as e:
             self.logger.error(f"Error handling key press event: {str(e)}", exc_info=True)
             return False  # Allow event propagation in case of error
     
-    def update_album_art(self) -> bool:
-        """Updates the displayed album art and background colors."""
+    def load_album_art(self, image_data: Optional[bytes]) -> Optional[AlbumArt]:
+        """
+        Decode the album art and its edge colors for handoff to the GTK thread.
+        
+        Runs off the main loop (on the tracker's album art worker) so image
+        decoding never stalls it. Texture creation from bytes is thread-safe
+        in GTK 4.
+        
+        Args:
+            image_data: Display-ready image bytes from the fetcher, or None if
+                fetching failed
+        
+        Returns:
+            The texture with its left and right edge colors, or None if the art
+            could not be loaded and the fallback image should be shown
+        """
+        if image_data is None:
+            self.logger.warning("No album art bytes available")
+            return None
+        
+        last_decoded = self._last_decoded_art
+        if last_decoded is not None and last_decoded[0] is image_data:
+            return last_decoded[1]
+        
+        art: Optional[AlbumArt] = None
         try:
-            album_art_loc = self.config['file_paths']['album_art_loc']
-            
-            if not os.path.exists(album_art_loc):
-                self.logger.warning(f"Album art file not found: {album_art_loc}")
-                self.set_fallback_image()
-                return False
-                
-            # Update the album art display
-            texture: Gdk.Texture = Gdk.Texture.new_from_filename(album_art_loc)
-            self.image.set_paintable(texture)
-            
-            # Extract dominant colors from the album art edges and update background
-            left_color, right_color = self.get_dominant_edge_colors(album_art_loc)
-            self.update_background_gradient(left_color, right_color)
-            self.logger.info(f"Updated album art from {album_art_loc}")
+            texture: Gdk.Texture = Gdk.Texture.new_from_bytes(GLib.Bytes.new(image_data))
+            left_color, right_color = self.get_dominant_edge_colors(image_data)
+            art = (texture, left_color, right_color)
+            self._last_decoded_art = (image_data, art)
+            self.logger.info(f"Loaded album art ({len(image_data)} bytes)")
         except Exception as e:
-            self.logger.error(f"Error updating album art: {str(e)}", exc_info=True)
+            self.logger.error(f"Error loading album art: {str(e)}", exc_info=True)
+        
+        return art
+    
+    def _queue_song_change(self, art: Optional[AlbumArt], song_info: Optional[Tuple[str, str]] = None) -> None:
+        """
+        Hand loaded album art and song info to the GTK thread in one callback.
+        
+        Only the newest change is kept, stored as a single tuple so the main loop
+        never pairs one song's art with another's labels; rapid track skips
+        collapse into a single main-loop wakeup.
+        """
+        self._pending_change = (art, song_info)
+        if not self._update_pending:
+            self._update_pending = True
+            GLib.idle_add(self._apply_song_change)
+    
+    def _apply_song_change(self) -> bool:
+        """Shows the most recently loaded album art, background colors and song info."""
+        # Cleared before the change is taken, so a change queued while this runs
+        # schedules a fresh handoff instead of being dropped
+        self._update_pending = False
+        art: Optional[AlbumArt]
+        song_info: Optional[Tuple[str, str]]
+        art, song_info = self._pending_change
+        
+        if art is None:
             self.set_fallback_image()
+        else:
+            try:
+                texture, left_color, right_color = art
+                self.image.set_paintable(texture)
+                self.update_background_gradient(left_color, right_color)
+            except Exception as e:
+                self.logger.error(f"Error updating album art: {str(e)}", exc_info=True)
+                self.set_fallback_image()
+        
+        if song_info is not None:
+            self.update_song_info(*song_info)
         
         return False  # Don't call again
     
     def set_fallback_image(self) -> None:
         """Displays a placeholder image and sets a default background."""
         try:
-            placeholder_loc = self.config['file_paths']['placeholder_loc']
+            # Decoded on first use and kept, so later fallbacks don't touch the disk
+            if self._placeholder_texture is None:
+                placeholder_loc = self.config['file_paths']['placeholder_loc']
 
-            if not os.path.exists(placeholder_loc):
-                self.logger.error(f"Placeholder image not found: {placeholder_loc}")
-                # Create an emergency fallback with a black background
-                self.update_background_gradient([0, 0, 0], [0, 0, 0])
-                return
-                
-            texture: Gdk.Texture = Gdk.Texture.new_from_filename(placeholder_loc)
-            self.image.set_paintable(texture)
+                if not os.path.exists(placeholder_loc):
+                    self.logger.error(f"Placeholder image not found: {placeholder_loc}")
+                    # Create an emergency fallback with a black background
+                    self.update_background_gradient([0, 0, 0], [0, 0, 0])
+                    return
+                    
+                self._placeholder_texture = Gdk.Texture.new_from_filename(placeholder_loc)
+            self.image.set_paintable(self._placeholder_texture)
             # Use default black background for placeholder
             self.update_background_gradient([0, 0, 0], [0, 0, 0])
             self.logger.info("Set fallback image")
@@ -342,20 +513,23 @@ class AlbumArtApp(Gtk.Application):
                 return False
             song_info_display_duration = self.config['display']['song_info_display_duration']    
             # Escape any Pango markup characters in the text
-            safe_artist: str = artist.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-            safe_title: str = title.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+            safe_artist: str = artist.translate(_PANGO_ESCAPE_TABLE)
+            safe_title: str = title.translate(_PANGO_ESCAPE_TABLE)
             
             # Add CSS class for background
             self.artist_label.get_style_context().add_class("has-text")
             self.title_label.get_style_context().add_class("has-text")
             
-            self.artist_label.set_markup(f'<span foreground="white" font="16" weight="bold">{safe_artist}</span>')
-            self.title_label.set_markup(f'<span foreground="white" font="14">{safe_title}</span>')
+            self.artist_label.set_markup(self._ARTIST_PREFIX + safe_artist + self._SPAN_SUFFIX)
+            self.title_label.set_markup(self._TITLE_PREFIX + safe_title + self._SPAN_SUFFIX)
             
             self.logger.info(f"Updated song info: {artist} - {title}")
 
-            # Schedule the text to disappear after the configured duration
-            GLib.timeout_add_seconds(song_info_display_duration, self.clear_song_info)
+            # Schedule the text to disappear after the configured duration, replacing
+            # the previous song's timer so it can't clear this song's info early
+            if self._song_info_clear_id is not None:
+                GLib.source_remove(self._song_info_clear_id)
+            self._song_info_clear_id = GLib.timeout_add_seconds(song_info_display_duration, self.clear_song_info)
         except Exception as e:
             self.logger.error(f"Error updating song info: {str(e)}", exc_info=True)
 
@@ -363,6 +537,7 @@ class AlbumArtApp(Gtk.Application):
   
     def clear_song_info(self) -> bool:
         """Clears the artist and title labels."""
+        self._song_info_clear_id = None
         try:
             if not self.artist_label or not self.title_label:
                 return False
@@ -387,14 +562,12 @@ class AlbumArtApp(Gtk.Application):
                 return False
                 
             # Escape any Pango markup characters in the text
-            safe_text: str = song_info.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+            safe_text: str = song_info.translate(_PANGO_ESCAPE_TABLE)
             
             # Add the CSS class for background
             self.queue_notification_label.get_style_context().add_class("has-text")
         
-            self.queue_notification_label.set_markup(
-                f'<span foreground="white" font="16" weight="bold">Added to queue:\n{safe_text}</span>'
-            )
+            self.queue_notification_label.set_markup(self._QUEUE_PREFIX + safe_text + self._SPAN_SUFFIX)
             
             self.logger.info(f"Queue notification displayed: {song_info}")
             queue_notification_duration = self.config['display']['queue_notification_duration']
@@ -428,14 +601,12 @@ class AlbumArtApp(Gtk.Application):
                 return False
                 
             # Escape any Pango markup characters in the text
-            safe_text: str = message.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+            safe_text: str = message.translate(_PANGO_ESCAPE_TABLE)
             
             # Add the CSS class for background
             self.queue_notification_label.get_style_context().add_class("has-text")
         
-            self.queue_notification_label.set_markup(
-                f'<span foreground="#FFA500" font="18" weight="bold">Command: {safe_text}</span>'
-            )
+            self.queue_notification_label.set_markup(self._COMMAND_PREFIX + safe_text + self._SPAN_SUFFIX)
             
             self.logger.info(f"Special command notification displayed: {message}")
             queue_notification_duration = self.config['display']['queue_notification_duration']
@@ -451,31 +622,39 @@ class AlbumArtApp(Gtk.Application):
         """Continuously checks MPD for song updates and updates UI."""
         
         last_song_path: Optional[str] = None
-        connection_retry_delay: int = 2  # seconds
-        connection_attempts: int = 0
-        max_connection_attempts: int = 10
 
         self.logger.info("Starting MPD monitoring loop")
+
+        # Verify the connection once up front; afterwards idle() itself
+        # reports disconnects, so no per-iteration ping is needed
+        self._mpd_connection_attempts = self._ensure_mpd_connection(
+            0, MPD_MAX_CONNECTION_ATTEMPTS, MPD_CONNECTION_RETRY_DELAY)
+        
+        # Show the placeholder until the first song's art has been fetched
+        self._queue_song_change(None)
+        
+        # None means the full state must be read: at startup and after a reconnect or error
+        changes: Optional[List[str]] = None
         
         while self.running.is_set():  # ← Check Event flag
             try:
-                # Check MPD connection and reconnect if needed
-                connection_attempts = self._ensure_mpd_connection(connection_attempts, max_connection_attempts, connection_retry_delay)
-                if connection_attempts > max_connection_attempts:
-                    time.sleep(30)  # Wait longer between attempts after max is reached
-                    connection_attempts = 5  # Reset but not to 0 to avoid too frequent attempts
-                    continue
+                if changes is None or "player" in changes:
+                    # Status is only needed for the queue length, which a
+                    # player-only event (play, pause, next track) leaves unchanged
+                    song_state: int = self.tracker.check_song_update(
+                        refresh_status=changes is None or "playlist" in changes)
                     
-                # After ensuring connection is active, check for song updates
-                song_state: int = self.tracker.check_song_update()
-                
-                # Handle song changes if detected
-                last_song_path = self._handle_song_change(song_state, last_song_path)
+                    # Handle song changes if detected
+                    last_song_path = self._handle_song_change(song_state, last_song_path)
+                else:
+                    # Only the queue changed; the current song and its art are unaffected
+                    self.tracker.refresh_queue_length()
                 
                 # Wait for MPD events with retry mechanism
-                self._wait_for_mpd_events()
+                changes = self._wait_for_mpd_events()
                     
             except Exception as e:
+                changes = None
                 self.logger.error(f"Error in mpd_loop: {str(e)}", exc_info=True)
                 if self.running.is_set():  # ← Only sleep if not shutting down
                     time.sleep(5)  # Add delay to avoid tight loop in case of recurring errors
@@ -518,51 +697,81 @@ class AlbumArtApp(Gtk.Application):
         current_song_path: Optional[str] = self.tracker.current_song.get("file") if self.tracker.current_song else None
         if song_state == 0 and current_song_path != last_song_path:
             self.logger.info(f"Detected song change: {current_song_path}")
-            GLib.idle_add(self.update_album_art)
-            
-            # Update song info if we have artist/title labels
-            if hasattr(self, 'artist_label') and hasattr(self, 'title_label') and self.tracker.current_song:
-                artist: str = self.tracker.current_song.get("artist", "Unknown Artist")
-                title: str = self.tracker.current_song.get("title", 
-                        os.path.basename(self.tracker.current_song.get("file", "Unknown Title")))
-                GLib.idle_add(self.update_song_info, artist, title)
-            
+            # The tracker fetches the new art on its worker thread and the display
+            # is refreshed from _on_album_art_ready once it is ready
             return current_song_path
         
         return last_song_path
+    
+    def _on_album_art_ready(self, song_file: str, art_bytes: Optional[bytes] = None) -> None:
+        """
+        Refresh the display once the tracker has fetched album art for song_file.
         
-    def _wait_for_mpd_events(self) -> None:
+        Called on the tracker's worker thread, so the art is decoded there; only
+        the texture handoff runs on the main loop. Art that did not change
+        (another track from the same album) is the same bytes object, so
+        load_album_art's identity memo returns the existing texture for free.
+        """
+        current_song: Optional[SongInfo] = self.tracker.current_song
+        if not current_song or current_song.get("file") != song_file:
+            self.logger.debug(f"Skipping album art for superseded song: {song_file}")
+            return
+        
+        art: Optional[AlbumArt] = self.load_album_art(art_bytes)
+        
+        # Update song info if we have artist/title labels
+        song_info: Optional[Tuple[str, str]] = None
+        if hasattr(self, 'artist_label') and hasattr(self, 'title_label'):
+            artist: str = current_song.get("artist", "Unknown Artist")
+            title: str = current_song.get("title", os.path.basename(song_file))
+            song_info = (artist, title)
+        
+        # Art, gradient and labels are applied together in one main-loop callback
+        self._queue_song_change(art, song_info)
+        
+    def _wait_for_mpd_events(self) -> Optional[List[str]]:
         """
         Wait for MPD events with robust reconnection mechanism.
         
         This method uses MPD's idle command to efficiently wait for changes,
         with automatic retry and reconnection logic for network interruptions.
         It avoids busy-waiting and implements progressive backoff for failures.
+        
+        Returns:
+            The MPD subsystems that changed, or None if the wait was cut short
+            (reconnect, failure or shutdown) and the full state should be re-read
         """
         retry_count: int = 3
         
         while retry_count > 0:
             try:
-                # The 'idle' command blocks until something changes in MPD
-                changes: List[str] = self.tracker.client.idle("player")
-                if changes:  # Only log if actual changes occurred
-                    self.logger.debug(f"MPD changes detected: {changes}")
-                # Reset retry count on success
-                retry_count = 3
-                return
+                # Waits on the tracker's dedicated idle connection until playback or the queue changes
+                changes: List[str] = self.tracker.wait_for_changes("player", "playlist")
+                if not changes:
+                    if not self.running.is_set():
+                        return None
+                    continue  # Interrupted with nothing to report; keep waiting
+                self.logger.debug(f"MPD changes detected: {changes}")
+                return changes
                 
             except ConnectionError as e:
+                if not self.running.is_set():
+                    return None  # Idle connection was closed for shutdown
                 self.logger.debug(f"MPD idle connection reset: {str(e)}")
                 retry_count -= 1
                 
-                # Try to reconnect using the tracker's established method
+                # Reconnect only once idle has reported the connection lost
                 if retry_count > 0:
                     self.logger.info("Attempting MPD reconnection from event handler")
-                    if self.tracker.reconnect_mpd():
-                        self.logger.info("Successfully reconnected to MPD from event handler")
-                        continue  # Skip the delay and try again immediately
-                    else:
-                        self.logger.warning("MPD reconnection failed from event handler")
+                    self._mpd_connection_attempts = self._ensure_mpd_connection(
+                        self._mpd_connection_attempts, MPD_MAX_CONNECTION_ATTEMPTS, MPD_CONNECTION_RETRY_DELAY)
+                    if self._mpd_connection_attempts == 0:
+                        return None  # Reconnected; changes may have been missed, so re-read everything
+                    if self._mpd_connection_attempts > MPD_MAX_CONNECTION_ATTEMPTS:
+                        time.sleep(30)  # Wait longer between attempts after max is reached
+                        self._mpd_connection_attempts = 5  # Reset but not to 0 to avoid too frequent attempts
+                        return None
+                    self.logger.warning("MPD reconnection failed from event handler")
                 
                 # Add delay before retry or final failure
                 time.sleep(1)
@@ -576,12 +785,15 @@ class AlbumArtApp(Gtk.Application):
         if retry_count == 0:
             self.logger.warning("All MPD idle retries failed, adding delay to avoid CPU spike")
             time.sleep(2)
+        return None
 
     def do_shutdown(self) -> None:
         """Handle application shutdown and cleanup resources."""
         try:
             self.logger.info("Application shutting down, performing cleanup")
             self.running.clear()  # ← Signal thread to exit (clear the Event)
+            if self.tracker:
+                self.tracker.interrupt_wait()  # End the blocking idle wait
             
             # Wait for thread to finish (with timeout to avoid hanging)
             if self.tracker_thread and self.tracker_thread.is_alive():
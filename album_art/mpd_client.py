@@ -3,58 +3,164 @@ File: album_art/mpd_client.py
 Description: MPD interaction classes (Tracker) with enhanced logging
 '''
 
-from mpd import MPDClient, CommandError  
+from mpd import MPDClient, CommandError, CommandListError, ConnectionError as MPDClientConnectionError
 import threading
+import queue
+import selectors
 import time
+import functools
 import os
+import array
 import logging
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple, Callable
 import board
-import busio
 import adafruit_ht16k33.segments
 import gi
 gi.require_version('Gtk', '4.0')
-from gi.repository import GLib
+from gi.repository import GLib, Gio
+from album_art.exceptions import DisplayError
+from album_art.fetcher import Fetcher
+
+_logger = logging.getLogger(f"{__name__}.Tracker")
+
+# Chunk size requested for binary responses (readpicture/albumart). MPD's
+# default of 8 KiB takes over a hundred round-trips for a large cover
+MPD_BINARY_LIMIT = 1024 * 1024
+
+# Keys accepted by the keypad; ASCII only, unlike str.isdigit()
+_DIGIT_KEYS = frozenset("0123456789")
+
+# Minimum interval between 7-segment display writes (~30 Hz); keys pressed
+# within it collapse into a single write of the latest value
+DISPLAY_FLUSH_INTERVAL_MS = 33
 
 class Tracker:
     """Tracks the currently playing song and queue length from MPD with comprehensive logging."""
     
-    def __init__(self, config) -> None:
-        """Initialize MPD tracker with connection and display setup."""
-        self.logger = logging.getLogger(f"{__name__}.Tracker")
+    def __init__(self, config, fetcher: Optional[Fetcher] = None) -> None:
+        """Initialize MPD tracker with connection and display setup.
+        
+        Args:
+            config: Application configuration
+            fetcher: Album art fetcher to reuse; one is created on the first song
+                change if not given
+        """
+        self.logger = _logger
         self.logger.info("Initializing MPD tracker")
         
         self.config = config
         self.client: MPDClient = MPDClient()
         self.client.timeout = 10
+        # Dedicated connection for blocking idle waits; MPD does not allow other
+        # commands on a connection while it is idling
+        self.idle_client: Optional[MPDClient] = None
+        self._idle_selector: Optional[selectors.BaseSelector] = None
+        # Self-pipe watched alongside the idle socket; interrupt_wait() writes to
+        # it so a blocking idle wait can end without MPD sending anything
+        self._idle_wake_r: Optional[int]
+        self._idle_wake_w: Optional[int]
+        self._idle_wake_r, self._idle_wake_w = os.pipe()
+        os.set_blocking(self._idle_wake_r, False)
+        os.set_blocking(self._idle_wake_w, False)
         self.lock: threading.Lock = threading.Lock()
         self.current_song: Optional[Dict[str, Any]] = None
         self.last_queue_length: int = 0
+        self.last_status: Dict[str, Any] = {}
         self.input_buffer: str = ""
         
-        # Initialize MPD connection
-        if not self.connect():
+        # Called from the worker thread once a song's album art is ready, with the
+        # song file and the display-ready image bytes (None if fetching failed)
+        self.on_album_art_ready: Optional[Callable[[str, Optional[bytes]], None]] = None
+        
+        # Shared with the caller or created on the first song change, then reused,
+        # so the placeholder is rendered once
+        self._fetcher: Optional[Fetcher] = fetcher
+        
+        # Latest song waiting for album art; a newer song change replaces it, so
+        # rapid skips fetch only the song that ends up playing
+        self._pending_art_song: Optional[str] = None
+        self._art_lock = threading.Lock()  # Guards _pending_art_song
+        self._art_event = threading.Event()
+        
+        # GTK application, looked up lazily (gtk_app imports this module)
+        self._app: Optional[Any] = None
+        
+        # Song list file contents as one bytes object with the byte offset of each
+        # line, rebuilt only when the file changes. A private copy rather than a
+        # live mmap, which would SIGBUS if the file were truncated and rewritten
+        self._song_list_data: bytes = b""
+        self._song_line_offsets: "array.array[int]" = array.array('q', [0])
+        self._song_list_mtime: Optional[float] = None
+        # Set by the file monitor (inotify on Linux) when the song list changes;
+        # while clear, a keypad selection needs no filesystem access at all
+        self._song_list_stale: bool = True
+        self._song_list_monitor: Optional[Gio.FileMonitor] = self._watch_song_list()
+        
+        # Per-instance memo of song tags; keypad selections repeat, and hits skip MPD entirely
+        self._lookup_song_metadata = functools.lru_cache(maxsize=1024)(self._lookup_song_metadata)
+        
+        # Initialize MPD connection, retrying with backoff in case MPD is still starting
+        if not self.connect() and not self.reconnect_mpd():
             self.logger.error("Initial MPD connection failed")
+            self._close_idle_wake_pipe()
             raise ConnectionError("Could not establish initial MPD connection")
         
         # Initialize hardware displays
         self._init_displays()
         
+        # Single worker serializes keypad commands instead of a thread per submission
+        self._cmd_queue: "queue.Queue[Tuple[Callable[..., None], Tuple[Any, ...]]]" = queue.Queue()
+        self._cmd_thread = threading.Thread(target=self._command_worker, daemon=True)
+        self._cmd_thread.start()
+        
+        # Album art is fetched on its own worker so keypad commands never wait behind it
+        self._art_thread = threading.Thread(target=self._album_art_worker, daemon=True, name="album-art")
+        self._art_thread.start()
+        
+        # Special keypad codes: code -> (command, log message, UI notification)
+        self._special_codes: Dict[int, Tuple[Callable[[], None], str, str]] = {
+            9999: (self.skip_song, "Skipping to next song", "Skipping to next song"),
+            8888: (self.stop_mpd, "Stopping playback", "Playback stopped"),
+            7777: (self.start_mpd, "Starting playback", "Playback started"),
+            6666: (self.clear_queue, "Clearing queue", "Queue cleared"),
+        }
+        
         self.logger.info("MPD tracker initialized successfully")
 
     def _init_displays(self):
-        """Initialize 7-segment displays with error handling."""
+        """Initialize 7-segment displays with error handling.
+        
+        Safe to call again: displays that are already set up are kept, and the
+        bus comes from Blinka's shared board.I2C() instance rather than a new
+        busio.I2C that would re-initialize the controller.
+        """
+        if getattr(self, 'display_queue', None) is not None and getattr(self, 'display_input', None) is not None:
+            self.logger.debug("I2C displays already initialized")
+            return
         try:
             self.logger.debug("Initializing I2C displays")
-            i2c = busio.I2C(board.SCL, board.SDA)
-            self.display_queue = adafruit_ht16k33.segments.Seg7x4(i2c, address=0x71)
-            self.display_input = adafruit_ht16k33.segments.Seg7x4(i2c, address=0x70)
+            i2c = board.I2C()
+            # Buffered displays: the display worker prints into the buffer and
+            # sends it with a single show() per update
+            self.display_queue = adafruit_ht16k33.segments.Seg7x4(i2c, address=0x71, auto_write=False)
+            self.display_input = adafruit_ht16k33.segments.Seg7x4(i2c, address=0x70, auto_write=False)
+            # Last value requested for each display; None while blank
+            self._last_queue_str: Optional[str] = None
+            self._last_input_str: Optional[str] = None
+            # One pending value per display, replaced by newer updates before the worker writes it
+            self._pending_display_values: Dict[adafruit_ht16k33.segments.Seg7x4, str] = {}
+            self._display_lock = threading.Lock()  # Guards the pending slots
+            self._display_io_lock = threading.Lock()  # Serializes I2C writes
+            self._display_event = threading.Event()
             self.display_queue.fill(0)
             self.display_input.fill(0)
+            self.display_queue.show()
+            self.display_input.show()
+            threading.Thread(target=self._display_worker, daemon=True, name="display-writer").start()
             self.logger.info("Displays initialized successfully")
         except Exception as e:
             self.logger.critical("Failed to initialize displays", exc_info=True)
-            raise Exception("Display initialization failed") from e
+            raise DisplayError("Display initialization failed") from e
 
     def execute_mpd_command(self, command: str, *args) -> Any:
         """Execute an MPD command with automatic reconnection handling.
@@ -66,76 +172,80 @@ class Tracker:
         Returns:
             The result of the command, or None if it failed
         """
-        max_attempts = 2  # Try twice at most
-        
-        for attempt in range(1, max_attempts + 1):
+        self.logger.debug("Executing MPD command: %s", command)
+        try:
+            # No ping beforehand: a dropped connection surfaces as an error
+            # from the command itself
+            with self.lock:
+                result = getattr(self.client, command)(*args)
+        except (ConnectionError, MPDClientConnectionError) as e:
+            self.logger.warning("MPD connection lost during '%s', reconnecting: %s", command, e)
+            if not self.reconnect_mpd():
+                self.logger.error("Failed to reconnect to MPD")
+                return None
+            # One retry on the fresh connection
             try:
                 with self.lock:
-                    self.logger.debug(f"Executing MPD command: {command}")
-                    
-                    # Check connection first
-                    try:
-                        self.client.ping()
-                    except Exception as e:
-                        if attempt == max_attempts:
-                            raise  # Re-raise on final attempt
-                        
-                        self.logger.warning(f"MPD connection lost, reconnecting (attempt {attempt})...")
-                        if not self.reconnect_mpd():
-                            self.logger.error("Failed to reconnect to MPD")
-                            return None
-                    
-                    # Execute command
-                    method = getattr(self.client, command)
-                    result = method(*args)
-                    self.logger.info(f"Successfully executed MPD command: {command}")
-                    return result
-                    
+                    result = getattr(self.client, command)(*args)
             except Exception as e:
-                if attempt < max_attempts:
-                    self.logger.warning(
-                        f"Failed to execute MPD command '{command}' (attempt {attempt}): {str(e)}"
-                    )
-                    # Try reconnecting before the next attempt
-                    self.reconnect_mpd()
-                else:
-                    self.logger.error(
-                        f"Failed to execute MPD command '{command}' after {max_attempts} attempts",
-                        exc_info=True
-                    )
-                    return None
+                self.logger.error("Failed to execute MPD command '%s' after reconnecting: %s",
+                                  command, e, exc_info=True)
+                return None
+        except Exception as e:
+            self.logger.error("Failed to execute MPD command '%s': %s", command, e, exc_info=True)
+            return None
+        
+        self.logger.info("Successfully executed MPD command: %s", command)
+        return result
+
+    def _mpd_settings(self) -> Tuple[str, int, Any]:
+        """Read the MPD host, port and password from config as one snapshot.
+        
+        Callers bind these to locals before any retry loop, so every attempt
+        uses the same settings even if the config is reloaded meanwhile.
+        """
+        mpd_config = self.config['mpd']
+        return mpd_config['host'], mpd_config['port'], mpd_config['password']
 
     def connect(self) -> bool:
         """Establish connection to MPD server with detailed logging."""
-        host = self.config['mpd']['host']
-        port = self.config['mpd']['port']
-        password = self.config['mpd']['password']
+        host, port, password = self._mpd_settings()
         
-        self.logger.info(f"Connecting to MPD at {host}:{port}")
+        self.logger.info("Connecting to MPD at %s:%s", host, port)
         try:
             self.client.connect(host, port)
             if password and password != 'false':
                 self.logger.debug("Authenticating with MPD password")
                 self.client.password(password)
+            self._raise_binary_limit()
             
             # Verify connection
             status = self.client.status()
-            self.logger.info(f"Connected to MPD (version: {status.get('version', 'unknown')})")
+            self.logger.info("Connected to MPD (version: %s)", status.get('version', 'unknown'))
             return True
         except (ConnectionError, CommandError) as e:
-            self.logger.error(f"MPD connection failed: {str(e)}", exc_info=True)
+            self.logger.error("MPD connection failed: %s", e, exc_info=True)
             return False
         except Exception as e:
-            self.logger.error(f"Unexpected error during MPD connection: {str(e)}", exc_info=True)
+            self.logger.error("Unexpected error during MPD connection: %s", e, exc_info=True)
             return False
 
+    def _raise_binary_limit(self) -> None:
+        """Ask MPD to send album art in MPD_BINARY_LIMIT chunks on the command client.
+        
+        Needs MPD 0.22.4 and a python-mpd2 that knows the command; on anything
+        older the default chunk size is kept.
+        """
+        try:
+            self.client.binarylimit(MPD_BINARY_LIMIT)
+        except (CommandError, AttributeError) as e:
+            self.logger.debug("MPD binarylimit not supported, keeping default chunk size: %s", e)
+
     def reconnect_mpd(self, max_attempts: int = 3) -> bool:
         """Reconnect to MPD with retry logic and detailed logging."""
-        host = self.config['mpd']['host']
-        port = self.config['mpd']['port']
-        password = self.config['mpd']['password']
+        host, port, password = self._mpd_settings()
         
-        self.logger.warning(f"Attempting MPD reconnection (max attempts: {max_attempts})")
+        self.logger.warning("Attempting MPD reconnection (max attempts: %s)", max_attempts)
         
         # Clean up existing connection
         try:
@@ -143,7 +253,7 @@ class Tracker:
             self.client.close()
             self.client.disconnect()
         except Exception as e:
-            self.logger.debug(f"Error closing existing connection: {str(e)}")
+            self.logger.debug("Error closing existing connection: %s", e)
 
         # Create fresh client
         self.client = MPDClient()
@@ -151,46 +261,165 @@ class Tracker:
         
         for attempt in range(1, max_attempts + 1):
             try:
-                self.logger.debug(f"Reconnection attempt {attempt}/{max_attempts}")
+                self.logger.debug("Reconnection attempt %s/%s", attempt, max_attempts)
                 self.client.connect(host, port)
                 if password and password != 'false':
                     self.client.password(password)
+                self._raise_binary_limit()
                 
                 # Verify reconnection
                 self.client.ping()
-                self.logger.info(f"Successfully reconnected to MPD (attempt {attempt})")
+                self.logger.info("Successfully reconnected to MPD (attempt %s)", attempt)
                 return True
             except Exception as e:
                 remaining = max_attempts - attempt
                 if remaining > 0:
                     wait_time = min(2 ** attempt, 10)  # Exponential backoff, max 10 seconds
                     self.logger.warning(
-                        f"Reconnection failed (attempt {attempt}), "
-                        f"retrying in {wait_time}s... Error: {str(e)}"
+                        "Reconnection failed (attempt %s), retrying in %ss... Error: %s",
+                        attempt, wait_time, e
                     )
                     time.sleep(wait_time)
         
-        self.logger.error(f"Failed to reconnect after {max_attempts} attempts")
+        self.logger.error("Failed to reconnect after %s attempts", max_attempts)
         return False
 
-    def check_song_update(self) -> int:
-        """Check for song updates with comprehensive state logging."""
+    def _open_idle_client(self) -> MPDClient:
+        """Open the dedicated idle connection to MPD."""
+        host, port, password = self._mpd_settings()
+        
+        self.logger.debug("Opening MPD idle connection to %s:%s", host, port)
+        client = MPDClient()
+        client.timeout = 10  # Reads only happen once the selector reports data
+        client.connect(host, port)
+        selector: Optional[selectors.BaseSelector] = None
+        try:
+            if password and password != 'false':
+                client.password(password)
+            
+            selector = selectors.DefaultSelector()
+            selector.register(client._sock, selectors.EVENT_READ)
+            selector.register(self._idle_wake_r, selectors.EVENT_READ)
+        except Exception:
+            # Don't leak the connected socket; the next wait opens a fresh one
+            if selector is not None:
+                selector.close()
+            try:
+                client.disconnect()
+            except Exception as e:
+                self.logger.debug("Error closing failed MPD idle connection: %s", e)
+            raise
+        self._idle_selector = selector
+        return client
+
+    def wait_for_changes(self, *subsystems: str, timeout: Optional[float] = None) -> List[str]:
+        """Wait until MPD reports a change in one of the given subsystems.
+        
+        Uses the dedicated idle connection so the command client stays free
+        for keypad commands while waiting. The idle command is sent and its
+        socket watched with a selector, so nothing is read until MPD has
+        actually answered and an idle player costs no round-trips at all.
+        interrupt_wait() ends the wait early. The idle connection is reopened
+        on the next call after any failure.
+        
+        Args:
+            *subsystems: MPD idle subsystems to wait on (default: player, playlist)
+            timeout: Seconds to wait before giving up, or None to wait until a
+                change or interrupt_wait()
+            
+        Returns:
+            The list of subsystems that changed; empty if interrupted or timed out
+            
+        Raises:
+            ConnectionError: If the idle connection could not be opened or was lost
+        """
+        try:
+            if self.idle_client is None:
+                self.idle_client = self._open_idle_client()
+            self.idle_client.send_idle(*(subsystems or ("player", "playlist")))
+            ready = self._idle_selector.select(timeout)
+            if any(key.fileobj == self._idle_wake_r for key, _ in ready):
+                self._drain_idle_wake()
+            elif ready:
+                return self.idle_client.fetch_idle()
+            # Interrupted or timed out; noidle ends the wait (and returns any change that raced it)
+            return self.idle_client.noidle()
+        except Exception as e:
+            self._close_idle_client()
+            raise ConnectionError(f"MPD idle connection failed: {str(e)}") from e
+
+    def interrupt_wait(self) -> None:
+        """Make a blocked or upcoming wait_for_changes() return early, e.g. for shutdown."""
+        if self._idle_wake_w is None:
+            return  # Already torn down
+        try:
+            os.write(self._idle_wake_w, b"\0")
+        except (BlockingIOError, OSError):
+            pass  # Pipe already full (a wake-up is pending) or closed
+
+    def _close_idle_wake_pipe(self) -> None:
+        """Close both ends of the idle wake-up pipe; safe to call more than once."""
+        for fd in (self._idle_wake_r, self._idle_wake_w):
+            if fd is not None:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+        self._idle_wake_r = self._idle_wake_w = None
+
+    def _drain_idle_wake(self) -> None:
+        """Discard pending wake-up bytes so the next wait blocks again."""
+        if self._idle_wake_r is None:
+            return
+        try:
+            while os.read(self._idle_wake_r, 4096):
+                pass
+        except (BlockingIOError, OSError):
+            pass
+
+    def _close_idle_client(self) -> None:
+        """Close the dedicated idle connection, unblocking any pending idle."""
+        idle_client, self.idle_client = self.idle_client, None
+        selector, self._idle_selector = self._idle_selector, None
+        if selector is not None:
+            selector.close()
+        if idle_client is None:
+            return
+        try:
+            idle_client.disconnect()
+        except Exception as e:
+            self.logger.debug("Error closing MPD idle connection: %s", e)
+
+    def check_song_update(self, refresh_status: bool = True) -> int:
+        """Check for song updates with comprehensive state logging.
+        
+        Args:
+            refresh_status: Also re-read status for the queue length. Pass False
+                when only the player subsystem changed, so a single currentsong
+                command is sent and the queue length is left as it was.
+        """
         try:
             with self.lock:
                 self.logger.debug("Checking for song updates")
                 
-                # Get current status
                 try:
-                    status = self.client.status()
-                    self.last_queue_length = int(status.get("playlistlength", 0))
-                    self.logger.debug(f"Current queue length: {self.last_queue_length}")
+                    if refresh_status:
+                        # Get current status and song in one round-trip
+                        status, current_song = self._fetch_status_and_song()
+                        self.last_status = status
+                        self.last_queue_length = int(status.get("playlistlength", 0))
+                        self.logger.debug("Current queue length: %s", self.last_queue_length)
+                    else:
+                        current_song = self.client.currentsong()
+                except (ConnectionError, CommandError):
+                    raise
                 except Exception as e:
                     self.logger.error("Failed to get MPD status", exc_info=True)
                     return 3  # Critical failure
 
                 # Store previous song for change detection
                 previous_song = self.current_song
-                self.current_song = self.client.currentsong() or {}
+                self.current_song = current_song or {}
                 
                 # Update queue display
                 self.update_queue_display()
@@ -198,8 +427,10 @@ class Tracker:
                 # Check for song change
                 current_file = self.current_song.get("file")
                 if current_file and (not previous_song or previous_song.get("file") != current_file):
-                    self.logger.info(f"Song changed to: {current_file}")
-                    self._handle_new_song(current_file)
+                    self.logger.info("Song changed to: %s", current_file)
+                    # Fetch album art on the worker thread; song change detection
+                    # returns without waiting on disk or network I/O
+                    self._request_album_art(current_file)
                     return 0  # Song changed
                 
                 return 2 if current_file else 1  # 2 = no song, 1 = same song
@@ -214,23 +445,105 @@ class Tracker:
             self.logger.error("Unexpected error in check_song_update", exc_info=True)
             return 3  # Critical failure
 
+    def refresh_queue_length(self) -> None:
+        """Re-read only the queue length after a playlist change and update its display.
+        
+        Used when MPD reports a playlist change without a player change, so the
+        current song (and its album art) need not be fetched again.
+        """
+        try:
+            with self.lock:
+                status = self.client.status()
+            self.last_status = status
+            self.last_queue_length = int(status.get("playlistlength", 0))
+            self.logger.debug("Current queue length: %s", self.last_queue_length)
+            self.update_queue_display()
+        except Exception as e:
+            self.logger.error("Failed to refresh MPD queue length: %s", e, exc_info=True)
+
+    def _fetch_status_and_song(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Fetch MPD status and the current song, pipelined as one command list.
+        
+        Must be called with self.lock held. If python-mpd2 reports an
+        inconsistent command-list state (CommandListError, e.g. a list left open
+        by an earlier failure), the list is abandoned and the two commands are
+        sent separately this once.
+        """
+        try:
+            self.client.command_list_ok_begin()
+            self.client.status()
+            self.client.currentsong()
+            status, current_song = self.client.command_list_end()
+            return status, current_song
+        except (CommandListError, ValueError) as e:
+            self.logger.warning("MPD command list failed, falling back to separate commands: %s", e)
+            try:
+                self.client.command_list_end()
+            except Exception:
+                pass  # No list was open
+            return self.client.status(), self.client.currentsong()
+
+    def _request_album_art(self, song_file: str) -> None:
+        """Hand song_file to the album art worker, replacing any song still waiting."""
+        with self._art_lock:
+            self._pending_art_song = song_file
+        self._art_event.set()
+
+    def _album_art_superseded(self) -> bool:
+        """Return True once a newer song is waiting for album art."""
+        return self._pending_art_song is not None
+
+    def _album_art_worker(self) -> None:
+        """Fetch album art for the most recently changed song, one fetch at a time."""
+        while True:
+            self._art_event.wait()
+            self._art_event.clear()
+            with self._art_lock:
+                song_file, self._pending_art_song = self._pending_art_song, None
+            if song_file is None:
+                continue
+            try:
+                self._handle_new_song(song_file)
+            except Exception as e:
+                self.logger.error("Album art worker failed for %s: %s", song_file, e, exc_info=True)
+
     def _handle_new_song(self, song_file: str):
-        """Handle new song detection with proper error handling."""
+        """Handle new song detection with proper error handling.
+        
+        Runs on the album art worker thread. on_album_art_ready is called afterwards
+        even if fetching failed, so the display can fall back to its placeholder;
+        it is skipped when a newer song arrived and the fetch was abandoned.
+        """
+        art_bytes: Optional[bytes] = None
         try:
-            from album_art.fetcher import Fetcher
-            fetcher = Fetcher(self.config)
-            fetcher.get_album_art(song_file, self.client)
-            self.logger.info(f"Album art updated for: {song_file}")
+            if self._fetcher is None:
+                self._fetcher = Fetcher(self.config)
+            fetcher = self._fetcher
+            # The fetcher takes the lock only around commands on the shared client,
+            # so status checks and keypad commands never wait on parsing or resizing
+            fetcher.get_album_art(
+                song_file, self.client, self._album_art_superseded, mpd_lock=self.lock)
+            art_bytes = fetcher.current_art_bytes
+            self.logger.info("Album art updated for: %s", song_file)
         except Exception as e:
-            self.logger.error(f"Failed to update album art for {song_file}", exc_info=True)
+            self.logger.error("Failed to update album art for %s", song_file, exc_info=True)
+        
+        if self._album_art_superseded():
+            self.logger.debug("Album art for %s superseded by a newer song", song_file)
+            return
+        
+        if self.on_album_art_ready:
+            self.on_album_art_ready(song_file, art_bytes)
 
     def update_queue_display(self) -> None:
         """Update queue display with error handling."""
         try:
             display_value = str(self.last_queue_length).rjust(4)
-            self.logger.debug(f"Updating queue display to: {display_value}")
-            self.display_queue.fill(0)
-            self.display_queue.print(display_value)
+            if display_value == self._last_queue_str:
+                return  # Already showing this value; no I2C traffic needed
+            self._last_queue_str = display_value
+            self.logger.debug("Updating queue display to: %s", display_value)
+            self._post_display_value(self.display_queue, display_value)
         except Exception as e:
             self.logger.error("Failed to update queue display", exc_info=True)
 
@@ -238,32 +551,56 @@ class Tracker:
         """Update input display with error handling."""
         try:
             display_value = self.input_buffer.rjust(4)
-            self.logger.debug(f"Updating input display to: {display_value}")
-            self.display_input.fill(0)
-            self.display_input.print(display_value)
+            if display_value == self._last_input_str:
+                return  # Already showing this value; no I2C traffic needed
+            self._last_input_str = display_value
+            self.logger.debug("Updating input display to: %s", display_value)
+            self._post_display_value(self.display_input, display_value)
         except Exception as e:
             self.logger.error("Failed to update input display", exc_info=True)
 
+    def _post_display_value(self, display: adafruit_ht16k33.segments.Seg7x4, display_value: str) -> None:
+        """Hand a 4-character value to the display worker, replacing any value not yet written."""
+        with self._display_lock:
+            self._pending_display_values[display] = display_value
+        self._display_event.set()
+
+    def _display_worker(self) -> None:
+        """Write the latest pending display values over I2C, off the GTK main thread.
+        
+        Each value costs one print() into the buffer and one show(): the displays
+        use auto_write=False, and rjust(4) fills every digit so no fill(0) is needed.
+        """
+        while True:
+            self._display_event.wait()
+            self._display_event.clear()
+            with self._display_lock:
+                pending, self._pending_display_values = self._pending_display_values, {}
+            try:
+                with self._display_io_lock:
+                    for display, display_value in pending.items():
+                        display.print(display_value)
+                        display.show()
+            except Exception as e:
+                self.logger.error("Failed to write displays", exc_info=True)
+            time.sleep(DISPLAY_FLUSH_INTERVAL_MS / 1000)
+
     def handle_input(self, key: str) -> None:
         """Handle user input with validation and logging."""
-        if not key.isdigit():
-            self.logger.debug(f"Ignoring non-digit input: {key}")
+        if key not in _DIGIT_KEYS:
+            self.logger.debug("Ignoring non-digit input: %s", key)
             return
             
-        if len(self.input_buffer) == 4:  
-            self.logger.debug("Input buffer full, clearing for new input")
-            self.input_buffer = ""
-            
-        self.input_buffer += key
-        self.input_buffer = self.input_buffer[-4:]
-        self.logger.info(f"Current input: {self.input_buffer}")
+        # A full buffer was already submitted, so the new key starts a fresh code
+        self.input_buffer = key if len(self.input_buffer) >= 4 else self.input_buffer + key
+        self.logger.info("Current input: %s", self.input_buffer)
         
-        GLib.idle_add(self.update_input_display)
+        self.update_input_display()
         
         if len(self.input_buffer) == 4:
             try:
                 line_number = int(self.input_buffer)
-                self.logger.info(f"Processing complete input: {line_number}")
+                self.logger.info("Processing complete input: %s", line_number)
 
                 """Check for special commands 
                 Summary:
@@ -275,86 +612,152 @@ class Tracker:
                 7777 → start_mpd() → Starts playback.
 
                 6666 → clear_queue() → Clears the queue."""
-                if line_number == 9999:
-                    self.logger.info("Special input detected: Skipping to next song")
-                    threading.Thread(target=self.skip_song, daemon=True).start()
-                    self._notify_special_command("Skipping to next song")
-                elif line_number == 8888:
-                    self.logger.info("Special input detected: Stopping playback")
-                    threading.Thread(target=self.stop_mpd, daemon=True).start()
-                    self._notify_special_command("Playback stopped")
-                elif line_number == 7777:
-                    self.logger.info("Special input detected: Starting playback")
-                    threading.Thread(target=self.start_mpd, daemon=True).start()
-                    self._notify_special_command("Playback started")
-                elif line_number == 6666:
-                    self.logger.info("Special input detected: Clearing queue")
-                    threading.Thread(target=self.clear_queue, daemon=True).start()
-                    self._notify_special_command("Queue cleared")
+                special = self._special_codes.get(line_number)
+                if special:
+                    handler, description, notification = special
+                    self.logger.info("Special input detected: %s", description)
+                    self._cmd_queue.put((handler, ()))
+                    self._notify_special_command(notification)
                 else:
-                    threading.Thread(
-                        target=self.add_song_to_mpd, 
-                        args=(line_number,), 
-                        daemon=True
-                    ).start()
+                    self._cmd_queue.put((self.add_song_to_mpd, (line_number,)))
             except ValueError:
-                self.logger.error(f"Invalid input conversion: {self.input_buffer}")
+                self.logger.error("Invalid input conversion: %s", self.input_buffer)
+
+    def _command_worker(self) -> None:
+        """Run queued keypad commands one at a time on a single daemon thread."""
+        while True:
+            func, args = self._cmd_queue.get()
+            try:
+                func(*args)
+            except Exception as e:
+                self.logger.error("Queued command %s failed: %s", func.__name__, e, exc_info=True)
+            finally:
+                self._cmd_queue.task_done()
 
     def add_song_to_mpd(self, line_number: int) -> None:
         """Add song to MPD queue with comprehensive logging."""
-        self.logger.info(f"Attempting to add song from line {line_number}")
-        
-        # Get song list path from config
-        song_list_path = self.config['file_paths']['song_list_path']
+        self.logger.info("Attempting to add song from line %s", line_number)
         
-        # Validate song list file
-        if not os.path.exists(song_list_path):
-            self.logger.error(f"Song list file not found: {song_list_path}")
-            return
-
         try:
-            # Read song list
-            with open(song_list_path, 'r') as file:
-                lines = file.readlines()
-                self.logger.debug(f"Read {len(lines)} lines from song list")
+            song_count = self._load_song_index()
+            if song_count is None:
+                return
 
             # Validate line number
-            if not (1 <= line_number <= len(lines)):
-                self.logger.error(f"Invalid line number {line_number} (valid range: 1-{len(lines)})")
+            if not (1 <= line_number <= song_count):
+                self.logger.error("Invalid line number %s (valid range: 1-%s)", line_number, song_count)
                 return
 
-            song_path = lines[line_number - 1].strip()
-            self.logger.info(f"Preparing to add song: {song_path}")
+            song_path = self._song_at(line_number - 1)
+            self.logger.info("Preparing to add song: %s", song_path)
             
-            # Ensure MPD connection
+            # Add song to queue; no ping beforehand, a dropped connection
+            # surfaces from add itself and gets one reconnect and retry
             try:
-                self.client.ping()
-            except Exception:
-                self.logger.warning("MPD connection lost, attempting reconnect")
-                if not self.reconnect_mpd():
-                    self.logger.error("Failed to reconnect to MPD")
-                    return
-
-            # Add song to queue
-            with self.lock:
                 try:
-                    self.client.add(song_path)
-                    self.last_queue_length += 1
-                    self.logger.info(f"Successfully added song: {song_path}")
-                    
-                    # Update display
-                    GLib.idle_add(self.update_queue_display)
-                    
-                    # Get song metadata for notification
-                    song_info = self._get_song_metadata(song_path)
-                    self._notify_song_added(song_info, song_path)
-                    
-                except CommandError as e:
-                    self.logger.error(f"MPD command failed while adding song: {str(e)}")
+                    with self.lock:
+                        self.client.add(song_path)
+                except (ConnectionError, MPDClientConnectionError) as e:
+                    self.logger.warning("MPD connection lost, attempting reconnect: %s", e)
+                    if not self.reconnect_mpd():
+                        self.logger.error("Failed to reconnect to MPD")
+                        return
+                    with self.lock:
+                        self.client.add(song_path)
+            except CommandError as e:
+                self.logger.error("MPD command failed while adding song: %s", e)
+                return
+            
+            self.last_queue_length += 1
+            self.logger.info("Successfully added song: %s", song_path)
+            
+            # Update display
+            self.update_queue_display()
+
+            # Get song metadata for notification; done after releasing the lock so
+            # check_song_update is not held up by the lookup
+            song_info = self._get_song_metadata(song_path)
+            self._notify_song_added(song_info, song_path)
 
         except Exception as e:
             self.logger.error("Unexpected error in add_song_to_mpd", exc_info=True)
 
+    def _load_song_index(self) -> Optional[int]:
+        """Read the song list and index its line offsets, redoing this only when its mtime changes.
+        
+        The file is kept as a single bytes object and a selected line is sliced
+        out of it on demand, so no per-keypress read or list of strings is needed.
+        While the file monitor reports no change, not even the mtime is checked.
+        
+        Returns:
+            The number of lines in the song list file, or None if it does not exist
+        """
+        if self._song_list_monitor is not None and not self._song_list_stale:
+            return len(self._song_line_offsets) - 1
+        
+        song_list_path = self.config['file_paths']['song_list_path']
+        
+        # Validate song list file
+        try:
+            mtime = os.stat(song_list_path).st_mtime
+        except FileNotFoundError:
+            self.logger.error("Song list file not found: %s", song_list_path)
+            return None
+        
+        self._song_list_stale = False
+        if mtime != self._song_list_mtime:
+            self._close_song_index()
+            with open(song_list_path, 'rb') as file:
+                data = file.read()
+            size = len(data)
+            offsets = array.array('q', [0])
+            pos = data.find(b'\n')
+            while pos != -1:
+                offsets.append(pos + 1)
+                pos = data.find(b'\n', pos + 1)
+            if offsets[-1] != size:
+                offsets.append(size)  # Last line has no trailing newline
+            self._song_list_data = data
+            self._song_line_offsets = offsets
+            self._song_list_mtime = mtime
+            self.logger.debug("Indexed %s lines from song list", len(offsets) - 1)
+        
+        return len(self._song_line_offsets) - 1
+
+    def _watch_song_list(self) -> Optional[Gio.FileMonitor]:
+        """Monitor the song list file so its index is only rebuilt after a change.
+        
+        Events are delivered on the main loop. If no monitor can be created,
+        None is returned and every selection falls back to an mtime check.
+        """
+        song_list_path = self.config['file_paths']['song_list_path']
+        try:
+            monitor = Gio.File.new_for_path(song_list_path).monitor_file(Gio.FileMonitorFlags.WATCH_MOVES, None)
+        except Exception as e:
+            self.logger.warning("Could not monitor song list %s, checking its mtime instead: %s", song_list_path, e)
+            return None
+        monitor.connect("changed", self._on_song_list_changed)
+        return monitor
+
+    def _on_song_list_changed(self, monitor: Gio.FileMonitor, file: Gio.File,
+                              other_file: Optional[Gio.File], event_type: Gio.FileMonitorEvent) -> None:
+        """Mark the song list index stale when the file is written, replaced or removed."""
+        if event_type == Gio.FileMonitorEvent.ATTRIBUTE_CHANGED:
+            return
+        self.logger.debug("Song list changed (%s); index will be rebuilt", event_type.value_nick)
+        self._song_list_stale = True
+
+    def _song_at(self, index: int) -> str:
+        """Return the stripped song path on the given 0-based line of the indexed song list."""
+        start, end = self._song_line_offsets[index], self._song_line_offsets[index + 1]
+        return self._song_list_data[start:end].decode('utf-8').strip()
+
+    def _close_song_index(self) -> None:
+        """Drop the song list contents and index."""
+        self._song_list_data = b""
+        self._song_line_offsets = array.array('q', [0])
+        self._song_list_mtime = None
+
     def skip_song(self) -> None:
         """Skip to the next song in MPD queue."""
         self.logger.info("Skipping to next song in MPD queue")
@@ -378,36 +781,52 @@ class Tracker:
     def _get_song_metadata(self, song_path: str) -> str:
         """Get song metadata with fallback to filename."""
         try:
-            song_data = self.client.find("file", song_path)
-            if song_data and len(song_data) > 0:
-                artist = song_data[0].get("artist", "")
-                title = song_data[0].get("title", "")
-                if artist and title:
-                    return f"{artist} - {title}"
-                elif title:
-                    return title
-            return song_path.split('/')[-1]
+            return self._lookup_song_metadata(song_path)
         except Exception as e:
-            self.logger.warning(f"Failed to get song metadata, using filename: {str(e)}")
+            self.logger.warning("Failed to get song metadata, using filename: %s", e)
             return song_path.split('/')[-1]
 
+    def _lookup_song_metadata(self, song_path: str) -> str:
+        """Look up the display name for a song from its MPD tags (memoized per instance).
+        
+        lsinfo on the exact path only touches that file, unlike find which scans
+        the whole database. Errors propagate so failed lookups are not cached.
+        """
+        with self.lock:
+            song_data = self.client.lsinfo(song_path)
+        if song_data and len(song_data) > 0:
+            artist = song_data[0].get("artist", "")
+            title = song_data[0].get("title", "")
+            if artist and title:
+                return f"{artist} - {title}"
+            elif title:
+                return title
+        return song_path.split('/')[-1]
+
+    def _get_app(self) -> Optional[Any]:
+        """Return the running GTK application, caching it once it exists."""
+        if self._app is None:
+            from album_art.gtk_app import app_instance
+            self._app = app_instance
+        return self._app
+
     def _notify_song_added(self, song_info: str, song_path: str):
         """Notify UI about added song."""
         try:
-            from album_art.gtk_app import app_instance
+            app_instance = self._get_app()
             if app_instance:
                 GLib.idle_add(app_instance.show_queue_notification, song_info)
-                self.logger.debug(f"Sent notification for added song: {song_path}")
+                self.logger.debug("Sent notification for added song: %s", song_path)
         except Exception as e:
             self.logger.warning("Failed to send song added notification", exc_info=True)
     
     def _notify_special_command(self, message: str):
         """Notify UI about special command execution."""
         try:
-            from album_art.gtk_app import app_instance
+            app_instance = self._get_app()
             if app_instance:
                 GLib.idle_add(app_instance.show_special_command_notification, message)
-                self.logger.debug(f"Sent notification for special command: {message}")
+                self.logger.debug("Sent notification for special command: %s", message)
         except Exception as e:
             self.logger.warning("Failed to send special command notification", exc_info=True)
 
@@ -415,19 +834,33 @@ class Tracker:
         """Clean up resources and clear displays before exit."""
         self.logger.info("Performing tracker cleanup")
         try:
-            # Clear the displays
-            self.display_queue.fill(0)
-            self.display_input.fill(0)
+            # Clear the displays, dropping any value the worker has yet to write
+            with self._display_lock:
+                self._pending_display_values.clear()
+            with self._display_io_lock:
+                self.display_queue.fill(0)
+                self.display_input.fill(0)
+                self.display_queue.show()
+                self.display_input.show()
+            self._last_queue_str = None
+            self._last_input_str = None
             self.logger.info("Cleared 7-segment displays")
             
+            if self._song_list_monitor is not None:
+                self._song_list_monitor.cancel()
+                self._song_list_monitor = None
+            self._close_song_index()
+            
             # Disconnect from MPD
             self.disconnect()
         except Exception as e:
-            self.logger.error(f"Error during tracker cleanup: {str(e)}", exc_info=True)
+            self.logger.error("Error during tracker cleanup: %s", e, exc_info=True)
     
     def disconnect(self) -> None:
         """Cleanly disconnect from MPD with logging."""
         self.logger.info("Disconnecting from MPD")
+        self._close_idle_client()
+        self._close_idle_wake_pipe()
         try:
             self.client.close()
             self.client.disconnect()
@@ -8,9 +8,12 @@ import warnings
 import logging
 from typing import Optional, Dict, Any
 
+_logger = logging.getLogger(f"{__name__}.utils")
+_setup_logger = logging.getLogger(f"{__name__}.setup")
+
 def suppress_gtk_warnings() -> None:
     """Suppress GTK warnings with logging of suppressed warnings."""
-    logger = logging.getLogger(f"{__name__}.utils")
+    logger = _logger
     try:
         warnings.filterwarnings('ignore', module='gi.repository.Gtk')
         os.environ['NO_AT_BRIDGE'] = '1'
@@ -32,7 +35,7 @@ def setup_logging(config: Dict[str, Any]) -> None:
         ValueError: If invalid log level is specified
     """
     # Create a basic logger to record setup process
-    logger = logging.getLogger(f"{__name__}.setup")
+    logger = _setup_logger
     logger.info("Initializing application logging")
     
     try:
@@ -59,7 +62,8 @@ def setup_logging(config: Dict[str, Any]) -> None:
             logger.critical(f"Cannot access log file: {log_file}", exc_info=True)
             raise PermissionError(f"Cannot access log file: {log_file}") from e
         
-        # Configure logging
+        # Configure logging; force replaces (and closes) any existing root handlers,
+        # so a repeat call neither no-ops nor writes every line twice
         try:
             logging.basicConfig(
                 level=log_level,
@@ -67,7 +71,8 @@ def setup_logging(config: Dict[str, Any]) -> None:
                 handlers=[
                     logging.FileHandler(log_file),
                     logging.StreamHandler()
-                ]
+                ],
+                force=True
             )
             logger.info(
                 f"Logging configured (level: {logging.getLevelName(log_level)}, "
@@ -40,8 +40,8 @@ def main():
         # Initialize the fetcher first to ensure placeholder image exists
         fetcher = Fetcher(config)
         
-        # Initialize the MPD tracker
-        tracker = Tracker(config)
+        # Initialize the MPD tracker, sharing the fetcher so the placeholder is rendered once
+        tracker = Tracker(config, fetcher)
         atexit.register(tracker.disconnect)
         
         # Initialize and run the GTK application